@@ -0,0 +1,52 @@
+"""Compare the per-row product functions with the bulk ones in products_DAO.
+
+Needs the MySQL database from sql_connection.py with at least one uom row.
+Usage: python bench_bulk.py [count]
+"""
+import sys
+import time
+
+import products_DAO
+from dashboard_DAO import ensure_rollup_tables
+from sql_connection import get_sql_connection
+
+def make_products(count, unit_id, prefix):
+    return [{'name': f'{prefix} product {i}', 'unitMessure_id': unit_id, 'price_per_unit': 1 + i % 50}
+            for i in range(count)]
+
+def timed(label, count, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22}{elapsed:>10.3f}{count / elapsed:>14.0f}")
+    return result
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    connection = get_sql_connection()
+    ensure_rollup_tables(connection)
+    cursor = connection.cursor()
+    cursor.execute("SELECT unitMessure_id FROM uom LIMIT 1")
+    unit_id = cursor.fetchone()[0]
+    cursor.close()
+
+    print(f"{'mode':<22}{'seconds':>10}{'products/s':>14}")
+
+    products = make_products(count, unit_id, 'per-row')
+    ids = timed('per-row insert', count,
+                lambda: [products_DAO.insert_new_product(connection, product) for product in products])
+    timed('per-row delete', count,
+          lambda: [products_DAO.delete_product(connection, product_id) for product_id in ids])
+
+    products = make_products(count, unit_id, 'bulk')
+    ids = timed('bulk insert', count, lambda: products_DAO.insert_products_bulk(connection, products))
+    for product, product_id in zip(products, ids):
+        product['product_id'] = product_id
+        product['price_per_unit'] += 1
+    timed('bulk upsert', count, lambda: products_DAO.upsert_products_bulk(connection, products))
+    timed('bulk delete', count, lambda: products_DAO.delete_products_bulk(connection, ids))
+
+    connection.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+
+
+class LocalBackend:
+    """In-process key/value store with per-key expiry."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            now = time.monotonic()
+            # Entries are only dropped on read otherwise, and keys that are
+            # never read again (old versions) would live forever
+            for stale in [k for k, (_, expires_at) in self._data.items()
+                          if expires_at is not None and now >= expires_at]:
+                del self._data[stale]
+            self._data[key] = (value, now + ttl if ttl else None)
+
+    def incr(self, key):
+        with self._lock:
+            value = int(self._data.get(key, (0, None))[0]) + 1
+            self._data[key] = (value, None)
+            return value
+
+    def delete_stale(self, prefix, keep_prefix):
+        """Drop keys under `prefix` except those under `keep_prefix`."""
+        with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix) and not k.startswith(keep_prefix)]:
+                del self._data[key]
+
+
+class RedisBackend:
+    """Shared store so every server process sees the same catalog and invalidations."""
+
+    def __init__(self, url):
+        import redis  # optional dependency, only needed for a shared cache
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        return self._client.get(key)
+
+    def set(self, key, value, ttl):
+        self._client.set(key, value, ex=max(1, int(ttl)) if ttl else None)
+
+    def incr(self, key):
+        return self._client.incr(key)
+
+    def delete_stale(self, prefix, keep_prefix):
+        pass  # Redis expires old versions on their TTL
+
+
+class CatalogCache:
+    """Pre-serialized product catalog with a TTL.
+
+    Entries are stored under the current catalog version; invalidate()
+    bumps the version, so a response built from data read before a write
+    can never be served after it, even if it finishes storing late.
+    Concurrent misses in one process share a single load.
+
+    `name` namespaces the keys, so other cached responses (e.g. the
+    dashboard) can share the backend with their own TTL.
+    """
+
+    def __init__(self, ttl=300, backend=None, name='catalog'):
+        self.name = name
+        self.ttl = ttl
+        self.backend = backend or LocalBackend()
+        self._load_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_or_load(self, load, variant=''):
+        """Cached payload, or the result of load() (a str) stored for next time.
+
+        `variant` names alternative encodings of the same data (e.g. a
+        columnar body); they are invalidated together.
+        """
+        payload = self.backend.get(self._key(variant))
+        if payload is not None:
+            self._count('hits')
+            return payload
+
+        with self._load_lock:
+            key = self._key(variant)
+            payload = self.backend.get(key)  # another thread may have just loaded it
+            if payload is not None:
+                self._count('hits')
+                return payload
+            self._count('misses')
+            payload = load()
+            self.backend.set(key, payload, self.ttl)
+            return payload
+
+    def invalidate(self):
+        """Call after any committed change to the cached data."""
+        version = self.backend.incr(f"{self.name}:version")
+        # Old versions are unreachable now; free them instead of waiting for the TTL
+        self.backend.delete_stale(f"{self.name}:payload:", f"{self.name}:payload:{version}:")
+        self._count('invalidations')
+
+    def stats(self):
+        with self._metrics_lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'name': self.name,
+                'ttl': self.ttl,
+                'backend': type(self.backend).__name__,
+            }
+
+    def _key(self, variant=''):
+        version = self.backend.get(f"{self.name}:version")
+        return f"{self.name}:payload:{int(version or 0)}:{variant}"
+
+    def _count(self, name):
+        with self._metrics_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+def _default_backend():
+    # Set CATALOG_CACHE_URL=redis://host:6379/0 to share the cache between processes
+    url = os.environ.get('CATALOG_CACHE_URL')
+    return RedisBackend(url) if url else LocalBackend()
+
+
+catalog_cache = CatalogCache(ttl=int(os.environ.get('CATALOG_CACHE_TTL', 300)),
+                             backend=_default_backend())
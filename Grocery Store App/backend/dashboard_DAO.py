@@ -0,0 +1,130 @@
+import threading
+from datetime import date, timedelta
+
+# Rollup tables behind /api/dashboard. The write paths in products_DAO and
+# orders_DAO update them in the same transaction as the rows they change,
+# so reading the dashboard never scans products or orders.
+#   dashboard_totals    one row (id = 1): revenue, orders, customers, products
+#   daily_sales         revenue and order count per day
+#   category_counts     products per unit of measure (products have no
+#                       category column; the uom is the closest grouping)
+#   dashboard_customers distinct customer names, to count new customers
+ROLLUP_TABLES = [
+    "CREATE TABLE IF NOT EXISTS dashboard_totals ("
+    " id TINYINT PRIMARY KEY, revenue DECIMAL(14, 2) NOT NULL DEFAULT 0,"
+    " orders INT NOT NULL DEFAULT 0, customers INT NOT NULL DEFAULT 0,"
+    " products INT NOT NULL DEFAULT 0)",
+    "CREATE TABLE IF NOT EXISTS daily_sales ("
+    " day DATE PRIMARY KEY, revenue DECIMAL(14, 2) NOT NULL, orders INT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS category_counts ("
+    " unitMessure_id INT PRIMARY KEY, products INT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS dashboard_customers ("
+    " customer_name VARCHAR(100) PRIMARY KEY)",
+]
+
+_rollups_ready = False
+_rollups_lock = threading.Lock()
+
+def ensure_rollup_tables(connection):
+    """Create the rollup tables and, the first time, fill them from the base tables.
+
+    Runs once per process. Every DAO function that touches the rollups
+    calls it before starting its transaction (CREATE TABLE commits
+    implicitly, so it can't run mid-transaction), so the tables exist
+    however the app or a script is started.
+    """
+    global _rollups_ready
+    if _rollups_ready:
+        return
+    with _rollups_lock:
+        if not _rollups_ready:
+            _create_rollup_tables(connection)
+            _rollups_ready = True
+
+def _create_rollup_tables(connection):
+    cursor = connection.cursor()
+    for statement in ROLLUP_TABLES:
+        cursor.execute(statement)
+
+    cursor.execute("SELECT id FROM dashboard_totals WHERE id = 1 FOR UPDATE")
+    if cursor.fetchone() is None:
+        # One-off backfill; from here on the write paths keep these current
+        cursor.execute("INSERT INTO daily_sales (day, revenue, orders) "
+                       "SELECT DATE(datetime), SUM(total), COUNT(*) FROM orders GROUP BY DATE(datetime)")
+        cursor.execute("INSERT INTO category_counts (unitMessure_id, products) "
+                       "SELECT unitMessure_id, COUNT(*) FROM products GROUP BY unitMessure_id")
+        cursor.execute("INSERT IGNORE INTO dashboard_customers (customer_name) "
+                       "SELECT DISTINCT customer_name FROM orders")
+        cursor.execute("INSERT INTO dashboard_totals (id, revenue, orders, customers, products) "
+                       "SELECT 1, (SELECT COALESCE(SUM(total), 0) FROM orders),"
+                       " (SELECT COUNT(*) FROM orders),"
+                       " (SELECT COUNT(*) FROM dashboard_customers),"
+                       " (SELECT COUNT(*) FROM products)")
+    connection.commit()
+    cursor.close()
+
+def apply_product_deltas(cursor, deltas):
+    """Add {unitMessure_id: change in product count} to the rollups.
+
+    Call inside the transaction that inserted or deleted the products.
+    """
+    deltas = {unit_id: delta for unit_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    cursor.executemany("INSERT INTO category_counts (unitMessure_id, products) VALUES (%s, %s) "
+                       "ON DUPLICATE KEY UPDATE products = products + VALUES(products)",
+                       list(deltas.items()))
+    cursor.execute("UPDATE dashboard_totals SET products = products + %s WHERE id = 1",
+                   (sum(deltas.values()),))
+
+def record_order(cursor, customer_name, total, day):
+    """Add one order to the rollups. Call inside the transaction that inserted it."""
+    cursor.execute("INSERT INTO daily_sales (day, revenue, orders) VALUES (%s, %s, 1) "
+                   "ON DUPLICATE KEY UPDATE revenue = revenue + VALUES(revenue), orders = orders + 1",
+                   (day, total))
+    cursor.execute("INSERT IGNORE INTO dashboard_customers (customer_name) VALUES (%s)",
+                   (customer_name,))
+    new_customers = cursor.rowcount
+    cursor.execute("UPDATE dashboard_totals SET revenue = revenue + %s, orders = orders + 1,"
+                   " customers = customers + %s WHERE id = 1",
+                   (total, new_customers))
+
+def get_dashboard(connection, days=7, recent_orders=5):
+    """Everything frontend/js/custom/dashboard.js renders, read from the rollups."""
+    ensure_rollup_tables(connection)
+    cursor = connection.cursor()
+
+    cursor.execute("SELECT revenue, orders, customers, products FROM dashboard_totals WHERE id = 1")
+    (revenue, orders, customers, products) = cursor.fetchone() or (0, 0, 0, 0)
+
+    first_day = date.today() - timedelta(days=days - 1)
+    cursor.execute("SELECT day, revenue FROM daily_sales WHERE day >= %s", (first_day,))
+    revenue_by_day = {day: float(value) for (day, value) in cursor}
+    sales_series = []
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        sales_series.append({"date": day.isoformat(), "value": revenue_by_day.get(day, 0.0)})
+
+    cursor.execute("SELECT u.uomName, c.products FROM category_counts c "
+                   "JOIN uom u ON c.unitMessure_id = u.unitMessure_id "
+                   "WHERE c.products > 0 ORDER BY c.products DESC")
+    categories = [{"name": name, "value": count} for (name, count) in cursor]
+
+    # Newest orders by primary key; orders have no status column
+    cursor.execute("SELECT order_id, customer_name, total FROM orders "
+                   "ORDER BY order_id DESC LIMIT %s", (recent_orders,))
+    recent = [{"id": order_id, "customer": customer_name, "total": float(total), "status": "Placed"}
+              for (order_id, customer_name, total) in cursor]
+
+    cursor.close()
+    return {
+        "totals": {
+            "revenue": float(revenue),
+            "orders": orders,
+            "customers": customers,
+            "products": products
+        },
+        "salesSeries": sales_series,
+        "categories": categories,
+        "recentOrders": recent
+    }
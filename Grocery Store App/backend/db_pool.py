@@ -0,0 +1,218 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+class _PooledConnection:
+    __slots__ = ('conn', 'created_at', 'last_used')
+
+    def __init__(self, conn):
+        now = time.monotonic()
+        self.conn = conn
+        self.created_at = now
+        self.last_used = now
+
+
+def default_ping(conn):
+    """Liveness check that reconnects in place if MySQL dropped the connection.
+
+    Falls back to SELECT 1 for drivers without ping(); those connections
+    are replaced by the pool instead.
+    """
+    if hasattr(conn, 'ping'):
+        conn.ping(reconnect=True, attempts=2, delay=0)
+    else:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        cursor.close()
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of DB-API connections.
+
+    `connect` is any zero-argument factory such as get_sql_connection.
+    Each request checks a connection out with `with pool.connection()`,
+    so concurrent requests never share a socket.
+
+    - At most `max_size` connections exist; checkouts beyond that wait up to
+      `timeout` seconds and then raise PoolTimeout.
+    - Connections idle for more than `health_check_after` seconds are pinged
+      (and reconnected) before being handed out; ones that still fail are
+      replaced, as are connections that error mid-request.
+    - Connections idle longer than `max_idle` or older than `max_lifetime`
+      are closed instead of reused.
+    """
+
+    def __init__(self, connect, max_size=10, timeout=5.0, max_idle=300.0,
+                 max_lifetime=3600.0, health_check_after=30.0, ping=default_ping):
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self._ping = ping
+
+        self._lock = threading.Condition()
+        self._idle = deque()  # most recently returned on the right
+        self._size = 0  # open connections, idle or checked out
+        self._closed = False
+
+        # Metrics
+        self._checkouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of a `with` block.
+
+        The transaction is rolled back if the block raises; connections
+        that fail even that are discarded rather than returned.
+        """
+        pooled = self._acquire()
+        broken = False
+        try:
+            yield pooled.conn
+        except Exception:
+            try:
+                pooled.conn.rollback()
+            except Exception:
+                broken = True
+            raise
+        finally:
+            self._release(pooled, broken)
+
+    def stats(self):
+        """Snapshot of pool usage counters."""
+        with self._lock:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'max_size': self.max_size,
+                'checkouts': self._checkouts,
+                'created': self._created,
+                'discarded': self._discarded,
+                'timeouts': self._timeouts,
+                'wait_avg_ms': (self._wait_total / self._checkouts * 1000) if self._checkouts else 0.0,
+                'wait_max_ms': self._wait_max * 1000,
+            }
+
+    def close(self):
+        """Close idle connections; checked-out ones are closed when returned."""
+        with self._lock:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._lock.notify_all()
+
+    def _acquire(self):
+        start = time.monotonic()
+        deadline = start + self.timeout
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise PoolTimeout("Connection pool is closed")
+
+                self._evict_expired()
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    # Reserve the slot, then connect outside the lock
+                    self._size += 1
+                    pooled = None
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(f"No connection available within {self.timeout}s")
+                self._lock.wait(remaining)
+
+        if pooled is not None:
+            pooled = self._check_health(pooled)
+        if pooled is None:
+            pooled = self._open()
+
+        waited = time.monotonic() - start
+        with self._lock:
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return pooled
+
+    def _release(self, pooled, broken):
+        if not broken:
+            # End any read transaction left open so the next user doesn't
+            # see an old REPEATABLE READ snapshot
+            try:
+                pooled.conn.rollback()
+            except Exception:
+                broken = True
+        now = time.monotonic()
+        with self._lock:
+            if broken or self._closed or now - pooled.created_at > self.max_lifetime:
+                self._discard(pooled)
+            else:
+                pooled.last_used = now
+                self._idle.append(pooled)
+            self._lock.notify()
+
+    def _open(self):
+        try:
+            pooled = _PooledConnection(self._connect())
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._created += 1
+        return pooled
+
+    def _check_health(self, pooled):
+        # Returns the connection if usable; otherwise closes it and returns
+        # None, keeping its slot reserved for a replacement
+        if time.monotonic() - pooled.last_used < self.health_check_after:
+            return pooled
+        try:
+            self._ping(pooled.conn)
+            return pooled
+        except Exception:
+            self._close_quietly(pooled.conn)
+            with self._lock:
+                self._discarded += 1
+            return None
+
+    def _evict_expired(self):
+        # Called with the lock held; idle deque is oldest-returned first
+        now = time.monotonic()
+        while self._idle and now - self._idle[0].last_used > self.max_idle:
+            self._discard(self._idle.popleft())
+        for pooled in [p for p in self._idle if now - p.created_at > self.max_lifetime]:
+            self._idle.remove(pooled)
+            self._discard(pooled)
+
+    def _discard(self, pooled):
+        # Called with the lock held
+        self._size -= 1
+        self._discarded += 1
+        self._close_quietly(pooled.conn)
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
@@ -0,0 +1,37 @@
+from datetime import datetime
+from sql_connection import get_sql_connection
+from dashboard_DAO import record_order, ensure_rollup_tables
+
+def insert_order(connection, order):
+    """Insert an order with its order_details rows and update the dashboard rollups.
+
+    `order` is {"customer_name", "grand_total", "order_details": [{"product_id",
+    "quantity", "total_price"}, ...]}. Returns the new order_id.
+    """
+    ensure_rollup_tables(connection)
+    cursor = connection.cursor()
+    now = datetime.now()
+
+    order_query = ("INSERT INTO orders (customer_name, total, datetime) "
+                   "VALUES (%s, %s, %s)")
+    order_data = (order['customer_name'], order['grand_total'], now)
+
+    cursor.execute(order_query, order_data)
+    order_id = cursor.lastrowid
+
+    order_details_query = ("INSERT INTO order_details (order_id, product_id, quantity, total_price) "
+                           "VALUES (%s, %s, %s, %s)")
+    order_details_data = [(order_id, int(detail['product_id']), float(detail['quantity']),
+                           float(detail['total_price']))
+                          for detail in order.get('order_details', [])]
+    if order_details_data:
+        cursor.executemany(order_details_query, order_details_data)
+
+    record_order(cursor, order['customer_name'], order['grand_total'], now.date())
+    connection.commit()
+    cursor.close()
+
+    return order_id
+
+if __name__ == "__main__":
+    connection = get_sql_connection()
@@ -1,27 +1,97 @@
 from sql_connection import get_sql_connection
+from collections import Counter
+from catalog_cache import catalog_cache
+from dashboard_DAO import apply_product_deltas, ensure_rollup_tables
+
+# Every function takes a connection checked out by the caller (server.py
+# uses `with pool.connection() as connection:`) and closes its cursors, so
+# the connection goes back to the pool clean. Writes invalidate the cached
+# catalog after they commit, and keep the dashboard rollups current in the
+# same transaction.
+
+PRODUCT_COLUMNS = ("SELECT p.product_id, p.name, p.unitMessure_id, p.price_per_unit, u.uomName "
+                   "FROM products p JOIN uom u ON p.unitMessure_id = u.unitMessure_id")
+
+def product_to_dict(row):
+    (product_id, name, unitMessure_id, price_per_unit, uomName) = row
+    return {
+        "product_id": product_id,
+        "name": name,
+        "unitMessure_id": unitMessure_id,
+        "price_per_unit": price_per_unit,
+        "uomName": uomName
+    }
 
 def get_all_products(connection):
     cursor = connection.cursor()
 
-    query = ("SELECT p.product_id, p.name, p.unitMessure_id, p.price_per_unit, u.uomName "
-             "FROM products p JOIN uom u ON p.unitMessure_id = u.unitMessure_id;")
+    query = PRODUCT_COLUMNS + ";"
 
     cursor.execute(query)
 
     response = []
     
-    for (product_id, name, unitMessure_id, price_per_unit, uomName) in cursor:
-        response.append({
-            "product_id": product_id,
-            "name": name,
-            "unitMessure_id": unitMessure_id,
-            "price_per_unit": price_per_unit,
-            "uomName": uomName
-        })
+    for row in cursor:
+        response.append(product_to_dict(row))
 
+    cursor.close()
     return response
 
+def get_all_products_columnar(connection):
+    """(column names, row tuples) for the whole catalog, without a dict per row."""
+    cursor = connection.cursor()
+
+    cursor.execute(PRODUCT_COLUMNS + ";")
+    rows = cursor.fetchall()
+    columns = cursor.column_names
+
+    cursor.close()
+    return columns, rows
+
+def get_products_page(connection, limit, after_id=None):
+    """One page of products in product_id order, starting after `after_id`.
+
+    Returns (products, next_after_id); next_after_id is None on the last page.
+    Keyset paging uses the primary key, so every page is an index range scan.
+    """
+    cursor = connection.cursor()
+
+    query = PRODUCT_COLUMNS
+    values = []
+    if after_id is not None:
+        query += " WHERE p.product_id > %s"
+        values.append(after_id)
+    # One extra row tells us whether another page exists
+    query += " ORDER BY p.product_id LIMIT %s"
+    values.append(limit + 1)
+
+    cursor.execute(query, tuple(values))
+    rows = cursor.fetchall()
+    cursor.close()
+
+    products = [product_to_dict(row) for row in rows[:limit]]
+    next_after_id = products[-1]["product_id"] if len(rows) > limit else None
+    return products, next_after_id
+
+def iter_products(connection, batch_size=500):
+    """Yield lists of at most `batch_size` products, streaming from the server.
+
+    The cursor is unbuffered, so only one batch of rows is held in memory
+    at a time; the connection is busy until the generator is exhausted or closed.
+    """
+    cursor = connection.cursor(buffered=False)
+    try:
+        cursor.execute(PRODUCT_COLUMNS + " ORDER BY p.product_id")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [product_to_dict(row) for row in rows]
+    finally:
+        cursor.close()
+
 def insert_new_product(connection, product):
+    ensure_rollup_tables(connection)
     cursor = connection.cursor()
 
     query = ("INSERT INTO products (name, unitMessure_id, price_per_unit) "
@@ -30,19 +100,144 @@ def insert_new_product(connection, product):
     data = (product['name'], product['unitMessure_id'], product['price_per_unit'])
 
     cursor.execute(query, data)
+    # Read before the rollup statements below reset it
+    product_id = cursor.lastrowid
+    apply_product_deltas(cursor, {product['unitMessure_id']: 1})
     connection.commit()
+    cursor.close()
+    catalog_cache.invalidate()
     
-    return cursor.lastrowid
+    return product_id
 
 def delete_product(connection, product_id):
+    ensure_rollup_tables(connection)
     cursor = connection.cursor()
 
-    query = ("DELETE FROM products WHERE product_id =" + str(product_id))
+    cursor.execute("SELECT unitMessure_id FROM products WHERE product_id = %s FOR UPDATE", (product_id,))
+    row = cursor.fetchone()
+    if row is None:
+        connection.rollback()
+        cursor.close()
+        return 0
+
+    query = ("DELETE FROM products WHERE product_id = %s")
     
-    cursor.execute(query)
+    cursor.execute(query, (product_id,))
+    deleted = cursor.rowcount
+    apply_product_deltas(cursor, {row[0]: -deleted})
     connection.commit()
+    cursor.close()
+    if deleted:
+        catalog_cache.invalidate()
     
-    return cursor.lastrowid
+    return deleted
+
+# Bulk writes for catalog syncs. Rows go through parameterized executemany
+# (mysql.connector sends an INSERT as one multi-row statement) and are
+# committed chunk by chunk, so a huge sync never holds one giant transaction.
+# If a chunk fails it is rolled back and the error raised; earlier chunks
+# stay committed.
+BULK_CHUNK_SIZE = 1000
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _product_values(product):
+    return (product['name'], product['unitMessure_id'], product['price_per_unit'])
+
+def _lock_product_units(cursor, product_ids):
+    """{product_id: unitMessure_id} for the existing ids, locked for this transaction."""
+    placeholders = ", ".join(["%s"] * len(product_ids))
+    cursor.execute(f"SELECT product_id, unitMessure_id FROM products "
+                   f"WHERE product_id IN ({placeholders}) FOR UPDATE", tuple(product_ids))
+    return dict(cursor.fetchall())
+
+def _run_chunks(connection, items, chunk_size, execute):
+    """Call execute(cursor, chunk) per chunk in its own transaction; returns the results."""
+    ensure_rollup_tables(connection)
+    results = []
+    cursor = connection.cursor()
+    try:
+        for chunk in _chunks(items, chunk_size):
+            try:
+                results.append(execute(cursor, chunk))
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+    finally:
+        cursor.close()
+        if results:
+            catalog_cache.invalidate()
+    return results
+
+def insert_products_bulk(connection, products, chunk_size=BULK_CHUNK_SIZE):
+    """Insert products; returns their new product_ids in input order."""
+    query = ("INSERT INTO products (name, unitMessure_id, price_per_unit) "
+             "VALUES (%s, %s, %s)")
+
+    def execute(cursor, chunk):
+        # A multi-row INSERT gets one block of ids, auto_increment_increment
+        # apart, only in InnoDB lock modes 0 and 1; in mode 2 (the MySQL 8
+        # default) concurrent inserts can interleave, so insert row by row
+        cursor.execute("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode")
+        step, lock_mode = cursor.fetchone()
+        values = [_product_values(product) for product in chunk]
+        if int(lock_mode) == 2:
+            ids = []
+            for row in values:
+                cursor.execute(query, row)
+                ids.append(cursor.lastrowid)
+        else:
+            cursor.executemany(query, values)
+            if cursor.rowcount != len(chunk):
+                raise RuntimeError(f"Multi-row INSERT added {cursor.rowcount} rows, expected {len(chunk)}")
+            ids = [cursor.lastrowid + int(step) * offset for offset in range(len(chunk))]
+        apply_product_deltas(cursor, Counter(product['unitMessure_id'] for product in chunk))
+        return ids
+
+    return [product_id for ids in _run_chunks(connection, products, chunk_size, execute)
+            for product_id in ids]
+
+def upsert_products_bulk(connection, products, chunk_size=BULK_CHUNK_SIZE):
+    """Insert or update products by product_id; returns the affected row count."""
+    query = ("INSERT INTO products (product_id, name, unitMessure_id, price_per_unit) "
+             "VALUES (%s, %s, %s, %s) "
+             "ON DUPLICATE KEY UPDATE name = VALUES(name), "
+             "unitMessure_id = VALUES(unitMessure_id), price_per_unit = VALUES(price_per_unit)")
+
+    def execute(cursor, chunk):
+        # Current unit of every product in the chunk, to move category counts
+        units = _lock_product_units(cursor, [product['product_id'] for product in chunk])
+        deltas = Counter()
+        for product in chunk:
+            old_unit = units.get(product['product_id'])
+            if old_unit is not None:
+                deltas[old_unit] -= 1
+            deltas[product['unitMessure_id']] += 1
+            units[product['product_id']] = product['unitMessure_id']
+
+        cursor.executemany(query, [(product['product_id'],) + _product_values(product)
+                                   for product in chunk])
+        affected = cursor.rowcount
+        apply_product_deltas(cursor, deltas)
+        return affected
+
+    return sum(_run_chunks(connection, products, chunk_size, execute))
+
+def delete_products_bulk(connection, product_ids, chunk_size=BULK_CHUNK_SIZE):
+    """Delete products by id; returns the number of rows deleted."""
+    def execute(cursor, chunk):
+        units = _lock_product_units(cursor, chunk)
+        # One IN (...) per chunk: executemany would still run a DELETE per id
+        placeholders = ", ".join(["%s"] * len(chunk))
+        cursor.execute(f"DELETE FROM products WHERE product_id IN ({placeholders})", tuple(chunk))
+        deleted = cursor.rowcount
+        apply_product_deltas(cursor, {unit: -count for unit, count in Counter(units.values()).items()})
+        return deleted
+
+    return sum(_run_chunks(connection, list(product_ids), chunk_size, execute))
 
 if __name__ == "__main__":
     connection = get_sql_connection()
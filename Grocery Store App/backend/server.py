@@ -1,24 +1,170 @@
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, stream_with_context
 import products_DAO
+import orders_DAO
+import dashboard_DAO
 from sql_connection import get_sql_connection
+from db_pool import ConnectionPool
+from catalog_cache import CatalogCache, catalog_cache
+from fast_response import init_app, columnar, wants_columnar
 import mysql.connector
 import json
 
 
 app = Flask(__name__)
+# orjson encoding, gzip/brotli compression and ?format=columnar support
+init_app(app)
 
-connection = get_sql_connection()
+# Each request checks out its own connection; idle ones are pinged and
+# reconnected before reuse, so a dropped MySQL connection no longer breaks
+# every request until restart
+pool = ConnectionPool(get_sql_connection, max_size=10, timeout=5.0,
+                      health_check_after=5.0)
 
+def load_products_json():
+    with pool.connection() as connection:
+        products = products_DAO.get_all_products(connection)
+    return app.json.dumps(products)
+
+def load_products_columnar_json():
+    with pool.connection() as connection:
+        columns, rows = products_DAO.get_all_products_columnar(connection)
+    return app.json.dumps(columnar(columns, rows))
+
+MAX_PAGE_SIZE = 500
+STREAM_BATCH_SIZE = 500
+
+def stream_products_json():
+    """The full catalog as a JSON array, written one fetchmany batch at a time."""
+    with pool.connection() as connection:
+        yield '['
+        first = True
+        for batch in products_DAO.iter_products(connection, STREAM_BATCH_SIZE):
+            items = app.json.dumps(batch)[1:-1]
+            yield items if first else ',' + items
+            first = False
+        yield ']'
+
+# Modes:
+#   /getProducts                    whole catalog, from the cache below
+#   /getProducts?limit=N&after=ID   one keyset page: {"products": [...], "next_after": ID or null}
+#   /getProducts?stream=1           whole catalog streamed straight from MySQL
+#   /getProducts?format=columnar    whole catalog as {"columns": [...], "rows": [[...]]}, cached
+# The catalog rarely changes, so the default mode serves the serialized list
+# from the cache; products_DAO invalidates it on every insert and delete
 @app.route('/getProducts' , methods=['GET'])
 def get_Products():
     
-    products = products_DAO.get_all_products(connection)
-    response = jsonify(products)
+    if request.args.get('limit') or request.args.get('after'):
+        try:
+            limit = min(max(int(request.args.get('limit', 100)), 1), MAX_PAGE_SIZE)
+            after_id = int(request.args['after']) if request.args.get('after') else None
+        except ValueError:
+            return jsonify({'message': 'limit and after must be integers'}), 400
+        with pool.connection() as connection:
+            products, next_after = products_DAO.get_products_page(connection, limit, after_id)
+        response = jsonify({'products': products, 'next_after': next_after})
+    elif request.args.get('stream'):
+        response = app.response_class(stream_with_context(stream_products_json()),
+                                      mimetype='application/json')
+    else:
+        if wants_columnar():
+            payload = catalog_cache.get_or_load(load_products_columnar_json, variant='columnar')
+        else:
+            payload = catalog_cache.get_or_load(load_products_json)
+        response = app.response_class(payload, mimetype='application/json')
+    response.headers.add('Access-Control-Allow-Origin', '*')
+    return response
+
+# Bulk endpoints for catalog syncs. Each takes a JSON array, or an object
+# holding it under "products" / "product_ids", validates every item first,
+# and then writes in chunked transactions through products_DAO
+PRODUCT_FIELDS = ['name', 'unitMessure_id', 'price_per_unit']
+
+def bulk_items(key):
+    data = request.get_json(silent=True)
+    items = data.get(key) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise ValueError(f"Expected a JSON array or an object with '{key}'")
+    return items
+
+def validate_products(products, require_id=False):
+    fields = (['product_id'] if require_id else []) + PRODUCT_FIELDS
+    for index, product in enumerate(products):
+        if not isinstance(product, dict) or any(product.get(field) in (None, '') for field in fields):
+            raise ValueError(f"Item {index}: {', '.join(fields)} are required")
+
+def json_response(body):
+    response = jsonify(body)
     response.headers.add('Access-Control-Allow-Origin', '*')
     return response
 
+@app.route('/insertProductsBulk', methods=['POST'])
+def insert_Products_Bulk():
+    try:
+        products = bulk_items('products')
+        validate_products(products)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    with pool.connection() as connection:
+        product_ids = products_DAO.insert_products_bulk(connection, products)
+    return json_response({'product_ids': product_ids})
+
+@app.route('/upsertProductsBulk', methods=['POST'])
+def upsert_Products_Bulk():
+    try:
+        products = bulk_items('products')
+        validate_products(products, require_id=True)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    with pool.connection() as connection:
+        affected = products_DAO.upsert_products_bulk(connection, products)
+    return json_response({'affected_rows': affected})
+
+@app.route('/deleteProductsBulk', methods=['POST'])
+def delete_Products_Bulk():
+    try:
+        product_ids = bulk_items('product_ids')
+        if not all(isinstance(product_id, int) for product_id in product_ids):
+            raise ValueError("product_ids must be integers")
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    with pool.connection() as connection:
+        deleted = products_DAO.delete_products_bulk(connection, product_ids)
+    return json_response({'deleted': deleted})
+
+@app.route('/insertOrder', methods=['POST'])
+def insert_Order():
+    order = request.get_json(silent=True)
+    if not isinstance(order, dict) or not order.get('customer_name') or order.get('grand_total') is None:
+        return jsonify({'message': 'customer_name and grand_total are required'}), 400
+    with pool.connection() as connection:
+        order_id = orders_DAO.insert_order(connection, order)
+    return json_response({'order_id': order_id})
+
+# Dashboard numbers come from rollup tables kept current by the write paths.
+# A short TTL still absorbs many dashboards refreshing at once: at most one
+# rollup read per process every DASHBOARD_TTL seconds
+DASHBOARD_TTL = 5
+dashboard_cache = CatalogCache(ttl=DASHBOARD_TTL, backend=catalog_cache.backend, name='dashboard')
+
+def load_dashboard_json():
+    with pool.connection() as connection:
+        return app.json.dumps(dashboard_DAO.get_dashboard(connection))
+
+@app.route('/api/dashboard', methods=['GET'])
+def get_Dashboard():
+    payload = dashboard_cache.get_or_load(load_dashboard_json)
+    response = app.response_class(payload, mimetype='application/json')
+    response.headers.add('Access-Control-Allow-Origin', '*')
+    response.headers['Cache-Control'] = f'max-age={DASHBOARD_TTL}'
+    return response
+
+@app.route('/getCacheStats', methods=['GET'])
+def get_Cache_Stats():
+    return jsonify({'catalog': catalog_cache.stats(), 'dashboard': dashboard_cache.stats()})
+
 if __name__ == "__main__":
     print("Starting Python Flask Server For Grocery Store App....")
-    app.run(port='5000')
+    app.run(port='5000', threaded=True)
        
     
@@ -1,29 +1,221 @@
+import argparse
+import bisect
+import csv
+import heapq
 import json
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import re
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single-process use only
+    fcntl = None
+
+# Sort order for priorities (high -> medium -> low); unknown values sort as medium
+PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _to_micros(dt: datetime) -> int:
+    """Naive local datetime -> integer microseconds since the epoch."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+def _from_micros(micros: int) -> datetime:
+    """Integer microseconds since the epoch -> naive local datetime."""
+    return _EPOCH + timedelta(microseconds=micros)
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by someone else
+    return True
+
+class WorkerLease:
+    """A worker ID leased from ``<store>.workers``, shared by every process using the store.
+    
+    The file maps worker IDs to the PIDs holding them and is only changed
+    under an exclusive lock. Each process takes the lowest ID not held by
+    a live process, so processes sharing a store never share a worker ID
+    (PIDs are not enough: they collide modulo the worker ID space).
+    """
+    
+    def __init__(self, store_path: str, max_workers: int):
+        self.path = store_path + ".workers"
+        self.pid = os.getpid()
+        with self._locked_leases() as leases:
+            live = {worker_id: pid for worker_id, pid in leases.items() if _pid_alive(pid)}
+            free = next((i for i in range(max_workers) if i not in live), None)
+            if free is None:
+                raise RuntimeError(f"All {max_workers} worker IDs for {store_path} are in use")
+            live[free] = self.pid
+            leases.clear()
+            leases.update(live)
+        self.worker_id = free
+    
+    def release(self):
+        """Give the ID back (only if this process still holds it)."""
+        with self._locked_leases() as leases:
+            if leases.get(self.worker_id) == self.pid:
+                del leases[self.worker_id]
+    
+    @contextmanager
+    def _locked_leases(self):
+        with open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                leases = {int(k): v for k, v in json.loads(f.read() or "{}").items()}
+            except ValueError:
+                leases = {}
+            yield leases
+            f.seek(0)
+            f.truncate()
+            json.dump(leases, f)
+            f.flush()
+
+class TaskIdAllocator:
+    """Snowflake-style task ID generator: milliseconds | worker | sequence.
+    
+    IDs are strictly increasing within a process and cannot collide across
+    processes with different worker IDs. The worker ID comes from
+    ``TASK_WORKER_ID`` if set; otherwise, given ``lease_path`` (the store's
+    file), a WorkerLease on that store; otherwise the process ID, which is
+    only unique modulo 1024. Legacy millisecond IDs are always smaller than
+    any ID produced here.
+    """
+    
+    EPOCH_MS = 1704067200000  # 2024-01-01T00:00:00Z
+    WORKER_BITS = 10
+    SEQUENCE_BITS = 12
+    
+    def __init__(self, worker_id: Optional[int] = None, lease_path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._fixed_worker_id = worker_id
+        self._lease_path = lease_path
+        self._lease = None
+        self._reset()
+    
+    def _reset(self):
+        # Also runs in a forked child: it must not keep the parent's worker ID
+        self._pid = os.getpid()
+        self._lease = None
+        worker_id = self._fixed_worker_id
+        if worker_id is None and "TASK_WORKER_ID" in os.environ:
+            worker_id = int(os.environ["TASK_WORKER_ID"])
+        if worker_id is None and self._lease_path and fcntl is not None:
+            self._lease = WorkerLease(self._lease_path, 1 << self.WORKER_BITS)
+            worker_id = self._lease.worker_id
+        if worker_id is None:
+            worker_id = os.getpid()
+        self.worker_id = worker_id & ((1 << self.WORKER_BITS) - 1)
+        self._last_ms = -1
+        self._sequence = 0
+    
+    def release(self):
+        """Return a leased worker ID to the store."""
+        if self._lease is not None and self._pid == os.getpid():
+            self._lease.release()
+        self._lease = None
+    
+    def next_id(self) -> int:
+        """Allocate the next ID."""
+        now_ms = time.time_ns() // 1_000_000 - self.EPOCH_MS
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            else:
+                # Same millisecond or the clock went backwards: keep counting
+                self._sequence += 1
+                if self._sequence >> self.SEQUENCE_BITS:
+                    # Sequence exhausted; borrow the next millisecond
+                    self._last_ms += 1
+                    self._sequence = 0
+            return ((self._last_ms << (self.WORKER_BITS + self.SEQUENCE_BITS))
+                    | (self.worker_id << self.SEQUENCE_BITS)
+                    | self._sequence)
+
+# Default allocator for Task objects built outside a manager; managers
+# re-number their tasks from an allocator leased on their own store
+_id_allocator = TaskIdAllocator()
 
 class Task:
-    """Represents a single task with basic properties."""
+    """Represents a single task with basic properties.
+    
+    Tasks are slotted and keep their timestamps as integer microseconds
+    since the epoch; ``created_at``/``completed_at`` still read and write
+    ISO strings so the on-disk format is unchanged.
+    """
+    
+    __slots__ = ('id', 'title', 'description', '_priority', 'priority_rank',
+                 'completed', 'created_ts', 'completed_ts')
     
     def __init__(self, title: str, description: str = "", priority: str = "medium"):
-        self.id = int(datetime.now().timestamp() * 1000)  # Unique ID
+        self.id = _id_allocator.next_id()  # Unique ID
         self.title = title
         self.description = description
-        self.priority = priority.lower()
+        self.priority = priority
         self.completed = False
-        self.created_at = datetime.now().isoformat()
-        self.completed_at = None
+        self.created_ts = _to_micros(datetime.now())
+        self.completed_ts = None
+    
+    @property
+    def priority(self) -> str:
+        return self._priority
+    
+    @priority.setter
+    def priority(self, value: str):
+        # Interned so the handful of priority strings are shared by every task
+        self._priority = sys.intern(value.lower())
+        self.priority_rank = PRIORITY_ORDER.get(self._priority, 1)
+    
+    @property
+    def created_at(self) -> str:
+        return _from_micros(self.created_ts).isoformat()
+    
+    @created_at.setter
+    def created_at(self, value: str):
+        self.created_ts = _to_micros(datetime.fromisoformat(value))
+    
+    @property
+    def completed_at(self) -> Optional[str]:
+        if self.completed_ts is None:
+            return None
+        return _from_micros(self.completed_ts).isoformat()
+    
+    @completed_at.setter
+    def completed_at(self, value: Optional[str]):
+        self.completed_ts = _to_micros(datetime.fromisoformat(value)) if value else None
+    
+    @property
+    def created_datetime(self) -> datetime:
+        """Creation time as a datetime, without going through the ISO string."""
+        return _from_micros(self.created_ts)
     
     def mark_complete(self):
         """Mark task as completed."""
         self.completed = True
-        self.completed_at = datetime.now().isoformat()
+        self.completed_ts = _to_micros(datetime.now())
     
     def mark_incomplete(self):
         """Mark task as incomplete."""
         self.completed = False
-        self.completed_at = None
+        self.completed_ts = None
     
     def to_dict(self) -> Dict:
         """Convert task to dictionary for JSON serialization."""
@@ -40,10 +232,15 @@ class Task:
     @classmethod
     def from_dict(cls, data: Dict):
         """Create task from dictionary."""
-        task = cls(data['title'], data.get('description', ''), data.get('priority', 'medium'))
+        # Skip __init__: the ID and timestamps come from the data
+        task = cls.__new__(cls)
         task.id = data['id']
+        task.title = data['title']
+        task.description = data.get('description', '')
+        task.priority = data.get('priority', 'medium')
         task.completed = data.get('completed', False)
-        task.created_at = data.get('created_at', datetime.now().isoformat())
+        created_at = data.get('created_at')
+        task.created_ts = _to_micros(datetime.fromisoformat(created_at) if created_at else datetime.now())
         task.completed_at = data.get('completed_at')
         return task
     
@@ -54,13 +251,373 @@ class Task:
         
         return f"{status} [{priority_symbol}] {self.title}"
 
+def task_from_row(row: Dict) -> Task:
+    """Validate an imported row (JSON object or CSV record) and build a new Task.
+    
+    The task always gets a fresh ID; completion state and timestamps are
+    kept when present so exported files round-trip.
+    """
+    title = (row.get('title') or '').strip()
+    if not title:
+        raise ValueError("Task title cannot be empty")
+    
+    priority = (row.get('priority') or 'medium').strip().lower()
+    if priority not in PRIORITY_ORDER:
+        raise ValueError(f"Invalid priority: {priority!r}")
+    
+    task = Task(title, (row.get('description') or '').strip(), priority)
+    if row.get('created_at'):
+        task.created_at = row['created_at']
+    
+    completed = row.get('completed', False)
+    if isinstance(completed, str):
+        completed = completed.strip().lower() in ("1", "true", "yes", "y")
+    if completed:
+        task.mark_complete()
+        if row.get('completed_at'):
+            task.completed_at = row['completed_at']
+    return task
+
+class TaskSearchIndex:
+    """Inverted index over task titles and descriptions.
+    
+    Every query term matches tokens that start with it, and all terms must
+    match (AND). Title hits weigh more than description hits and exact
+    token matches more than prefix matches.
+    """
+    
+    TOKEN_PATTERN = re.compile(r"\w+")
+    TITLE_WEIGHT = 3
+    DESCRIPTION_WEIGHT = 1
+    
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._vocabulary: List[str] = []  # sorted, for prefix lookups
+        self._tokens_by_task: Dict[int, Dict[str, int]] = {}
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        return cls.TOKEN_PATTERN.findall(text.lower())
+    
+    def add(self, task: Task):
+        """Index a task's title and description."""
+        weights: Dict[str, int] = {}
+        for token in self.tokenize(task.title):
+            weights[token] = weights.get(token, 0) + self.TITLE_WEIGHT
+        for token in self.tokenize(task.description):
+            weights[token] = weights.get(token, 0) + self.DESCRIPTION_WEIGHT
+        
+        self._tokens_by_task[task.id] = weights
+        for token, weight in weights.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                bisect.insort(self._vocabulary, token)
+            posting[task.id] = weight
+    
+    def remove(self, task_id: int):
+        """Drop a task from the index."""
+        for token in self._tokens_by_task.pop(task_id, {}):
+            posting = self._postings[token]
+            del posting[task_id]
+            if not posting:
+                del self._postings[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+    
+    def clear(self):
+        self._postings.clear()
+        self._vocabulary.clear()
+        self._tokens_by_task.clear()
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Return ``(task_id, score)`` pairs matching every query term, best first."""
+        terms = self.tokenize(query)
+        if not terms:
+            return []
+        
+        # Resolve each term to its scores, then intersect starting from the rarest
+        term_scores = sorted((self._term_scores(term) for term in terms), key=len)
+        scores = dict(term_scores[0])
+        for other in term_scores[1:]:
+            if not scores:
+                break
+            scores = {task_id: score + other[task_id]
+                      for task_id, score in scores.items() if task_id in other}
+        
+        rank = lambda item: (-item[1], item[0])
+        if limit is not None:
+            return heapq.nsmallest(limit, scores.items(), key=rank)
+        return sorted(scores.items(), key=rank)
+    
+    def _term_scores(self, term: str) -> Dict[int, int]:
+        exact = self._postings.get(term)
+        scores: Dict[int, int] = {}
+        start = bisect.bisect_left(self._vocabulary, term)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            if token == term:
+                continue
+            for task_id, weight in self._postings[token].items():
+                scores[task_id] = max(scores.get(task_id, 0), weight)
+        if exact:
+            # Exact matches outrank prefix matches of the same field
+            for task_id, weight in exact.items():
+                scores[task_id] = max(scores.get(task_id, 0), weight * 2)
+        return scores
+
+class TaskStore:
+    """In-memory task storage indexed by ID, priority and completion state.
+    
+    Each (priority, completed) bucket also keeps a sorted list of
+    ``(created_ts, id)`` keys so tasks can be streamed in display order
+    without sorting the whole store.
+    """
+    
+    def __init__(self):
+        self._by_id: Dict[int, Task] = {}
+        self._by_priority: Dict[str, Dict[int, Task]] = {}
+        self._by_status: Dict[bool, Dict[int, Task]] = {True: {}, False: {}}
+        self._pending_by_priority: Dict[str, int] = {}
+        self._order: Dict[Tuple[str, bool], List[Tuple[int, int]]] = {}
+        self._search = TaskSearchIndex()
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
+    
+    def __iter__(self) -> Iterator[Task]:
+        return iter(list(self._by_id.values()))
+    
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._by_id
+    
+    def get(self, task_id: int) -> Optional[Task]:
+        """Get task by ID in O(1)."""
+        return self._by_id.get(task_id)
+    
+    def add(self, task: Task):
+        """Add a task and register it in every index."""
+        self._index(task)
+        self._reorder(task)
+    
+    def add_many(self, tasks: Iterable[Task]):
+        """Add several tasks, sorting each ordered bucket once at the end."""
+        touched = set()
+        for task in tasks:
+            self._index(task)
+            key = (task.priority, task.completed)
+            self._order.setdefault(key, []).append((task.created_ts, task.id))
+            touched.add(key)
+        for key in touched:
+            self._order[key].sort()
+    
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Remove a task from every index and return it."""
+        task = self._by_id.pop(task_id, None)
+        if task is None:
+            return None
+        
+        self._unorder(task)
+        self._search.remove(task.id)
+        self._unindex_priority(task)
+        del self._by_status[task.completed][task.id]
+        if not task.completed:
+            self._count_pending(task.priority, -1)
+        return task
+    
+    def set_text(self, task: Task, title: Optional[str] = None,
+                 description: Optional[str] = None):
+        """Change a task's title and/or description and reindex it for search."""
+        self._search.remove(task.id)
+        if title is not None:
+            task.title = title
+        if description is not None:
+            task.description = description
+        self._search.add(task)
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """Tasks matching every query term (as prefixes), best match first."""
+        return [self._by_id[task_id] for task_id, _ in self._search.search(query, limit)]
+    
+    def set_priority(self, task: Task, priority: str):
+        """Change a task's priority and move it to the matching bucket."""
+        priority = priority.lower()
+        if priority == task.priority:
+            return
+        
+        self._unorder(task)
+        self._unindex_priority(task)
+        if not task.completed:
+            self._count_pending(task.priority, -1)
+            self._count_pending(priority, 1)
+        task.priority = priority
+        self._by_priority.setdefault(priority, {})[task.id] = task
+        self._reorder(task)
+    
+    def set_completed(self, task: Task, completed: bool):
+        """Change a task's completion state and move it between buckets."""
+        if completed == task.completed:
+            return
+        
+        self._unorder(task)
+        del self._by_status[task.completed][task.id]
+        if completed:
+            task.mark_complete()
+        else:
+            task.mark_incomplete()
+        self._by_status[task.completed][task.id] = task
+        self._count_pending(task.priority, -1 if completed else 1)
+        self._reorder(task)
+    
+    def by_priority(self, priority: str) -> List[Task]:
+        """Tasks with the given priority."""
+        return list(self._by_priority.get(priority.lower(), {}).values())
+    
+    def by_status(self, completed: bool) -> List[Task]:
+        """Tasks with the given completion state."""
+        return list(self._by_status[completed].values())
+    
+    def iter_ordered(self, priority: Optional[str] = None,
+                     completed: Optional[bool] = None) -> Iterator[Task]:
+        """Lazily yield tasks by priority (high -> medium -> low), then creation time.
+        
+        Only the buckets matching the filters are visited, so the first
+        results arrive without touching the rest of the store.
+        """
+        states = [False, True] if completed is None else [completed]
+        priorities = [priority.lower()] if priority else list(self._by_priority)
+        
+        # Unknown priorities share medium's rank, so merge buckets of equal rank
+        by_rank: Dict[int, List[List[Tuple[int, int]]]] = {}
+        for bucket_priority in priorities:
+            for state in states:
+                keys = self._order.get((bucket_priority, state))
+                if keys:
+                    by_rank.setdefault(PRIORITY_ORDER.get(bucket_priority, 1), []).append(keys)
+        
+        for rank in sorted(by_rank):
+            for _, task_id in heapq.merge(*by_rank[rank]):
+                task = self._by_id.get(task_id)
+                if task is not None:
+                    yield task
+    
+    def stats(self) -> Dict:
+        """Task counts from the maintained counters, in O(1)."""
+        total = len(self._by_id)
+        completed = len(self._by_status[True])
+        return {
+            "total": total,
+            "completed": completed,
+            "pending": total - completed,
+            "high_priority": self._pending_by_priority.get("high", 0),
+            "medium_priority": self._pending_by_priority.get("medium", 0),
+            "low_priority": self._pending_by_priority.get("low", 0)
+        }
+    
+    def recount_stats(self) -> Dict:
+        """Task counts from a full scan, for checking the counters."""
+        total = len(self._by_id)
+        completed = sum(1 for task in self._by_id.values() if task.completed)
+        
+        priority_counts = {"high": 0, "medium": 0, "low": 0}
+        for task in self._by_id.values():
+            if not task.completed:
+                priority_counts[task.priority] = priority_counts.get(task.priority, 0) + 1
+        
+        return {
+            "total": total,
+            "completed": completed,
+            "pending": total - completed,
+            "high_priority": priority_counts["high"],
+            "medium_priority": priority_counts["medium"],
+            "low_priority": priority_counts["low"]
+        }
+    
+    def clear(self):
+        """Drop every task and index entry."""
+        self._by_id.clear()
+        self._by_priority.clear()
+        self._by_status = {True: {}, False: {}}
+        self._pending_by_priority.clear()
+        self._order.clear()
+        self._search.clear()
+    
+    def _index(self, task: Task):
+        if task.id in self._by_id:
+            raise ValueError(f"Duplicate task ID: {task.id}")
+        
+        self._by_id[task.id] = task
+        self._by_priority.setdefault(task.priority, {})[task.id] = task
+        self._by_status[task.completed][task.id] = task
+        if not task.completed:
+            self._count_pending(task.priority, 1)
+        self._search.add(task)
+    
+    def _reorder(self, task: Task):
+        bisect.insort(self._order.setdefault((task.priority, task.completed), []),
+                      (task.created_ts, task.id))
+    
+    def _unorder(self, task: Task):
+        key = (task.priority, task.completed)
+        keys = self._order[key]
+        del keys[bisect.bisect_left(keys, (task.created_ts, task.id))]
+        if not keys:
+            del self._order[key]
+    
+    def _count_pending(self, priority: str, delta: int):
+        self._pending_by_priority[priority] = self._pending_by_priority.get(priority, 0) + delta
+    
+    def _unindex_priority(self, task: Task):
+        bucket = self._by_priority[task.priority]
+        del bucket[task.id]
+        if not bucket:
+            del self._by_priority[task.priority]
+
 class TaskManager:
-    """Manages a collection of tasks with persistence."""
+    """Manages a collection of tasks with persistence.
+    
+    With ``journal=True`` every mutation is appended to ``<filename>.journal``
+    as one compact JSON line instead of rewriting the whole file. Loading
+    replays the snapshot plus the journal, and once the journal holds
+    ``compact_threshold`` records it is folded into a new snapshot.
+    
+    Several processes can share one store. Writes hold an exclusive
+    ``<filename>.lock`` advisory lock and first pull in changes made by
+    other processes, so each mutation applies to the latest state; updates
+    to tasks deleted elsewhere are rejected. Reads check the files' inode,
+    mtime and size and reload only when something actually changed (in
+    journal mode, only the new journal tail is replayed).
+    """
     
-    def __init__(self, filename: str = "tasks.json"):
+    def __init__(self, filename: str = "tasks.json", journal: bool = False,
+                 compact_threshold: int = 1000, fsync: bool = False):
         self.filename = filename
-        self.tasks: List[Task] = []
-        self.load_tasks()
+        self.journal = journal
+        self.journal_filename = filename + ".journal"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.store = TaskStore()
+        self._journal_file = None
+        self._journal_records = 0
+        self._journal_offset = 0
+        self._journal_ino = None
+        self._snapshot_signature = None
+        self._lock_file = None
+        self._lock_depth = 0
+        self._ids = TaskIdAllocator(lease_path=filename)
+        with self._locked(exclusive=False):
+            self.load_tasks()
+    
+    @property
+    def tasks(self) -> List[Task]:
+        """All tasks, in insertion order."""
+        self.refresh()
+        return list(self.store)
+    
+    def refresh(self):
+        """Pick up changes written by other processes, if there are any."""
+        with self._locked(exclusive=False):
+            self._sync()
     
     def add_task(self, title: str, description: str = "", priority: str = "medium") -> Task:
         """Add a new task."""
@@ -68,115 +625,676 @@ class TaskManager:
             raise ValueError("Task title cannot be empty")
         
         task = Task(title.strip(), description.strip(), priority)
-        self.tasks.append(task)
-        self.save_tasks()
+        with self._locked(exclusive=True):
+            self._sync()
+            self._assign_id(task)
+            self.store.add(task)
+            self._persist_put(task)
         return task
     
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get task by ID."""
-        return next((task for task in self.tasks if task.id == task_id), None)
+        self.refresh()
+        return self.store.get(task_id)
     
     def update_task(self, task_id: int, title: str = None, description: str = None, 
                    priority: str = None) -> bool:
         """Update an existing task."""
-        task = self.get_task(task_id)
-        if not task:
-            return False
-        
-        if title is not None:
-            task.title = title.strip()
-        if description is not None:
-            task.description = description.strip()
-        if priority is not None:
-            task.priority = priority.lower()
-        
-        self.save_tasks()
+        with self._locked(exclusive=True):
+            self._sync()
+            task = self.store.get(task_id)
+            if not task:
+                return False
+            
+            if title is not None or description is not None:
+                self.store.set_text(task,
+                                    title.strip() if title is not None else None,
+                                    description.strip() if description is not None else None)
+            if priority is not None:
+                self.store.set_priority(task, priority)
+            
+            self._persist_put(task)
         return True
     
     def delete_task(self, task_id: int) -> bool:
         """Delete a task by ID."""
-        task = self.get_task(task_id)
-        if not task:
-            return False
-        
-        self.tasks.remove(task)
-        self.save_tasks()
+        with self._locked(exclusive=True):
+            self._sync()
+            if self.store.remove(task_id) is None:
+                return False
+            
+            self._persist_delete(task_id)
         return True
     
     def toggle_task(self, task_id: int) -> bool:
         """Toggle task completion status."""
-        task = self.get_task(task_id)
-        if not task:
-            return False
+        with self._locked(exclusive=True):
+            self._sync()
+            task = self.store.get(task_id)
+            if not task:
+                return False
+            
+            self.store.set_completed(task, not task.completed)
+            
+            self._persist_put(task)
+        return True
+    
+    def add_tasks_bulk(self, rows: Iterable[Dict], errors: Optional[List[str]] = None,
+                       first_row: int = 1) -> List[Task]:
+        """Add many tasks and persist them once.
         
-        if task.completed:
-            task.mark_incomplete()
-        else:
-            task.mark_complete()
+        Rows are validated with ``task_from_row``. If ``errors`` is given,
+        invalid rows are skipped and described there; otherwise the first
+        invalid row raises ValueError and nothing is added. Rows are
+        numbered from ``first_row`` in error messages.
+        """
+        tasks = _build_tasks(rows, errors, first_row)
+        if not tasks:
+            return tasks
         
-        self.save_tasks()
-        return True
+        with self._locked(exclusive=True):
+            self._sync()
+            for task in tasks:
+                self._assign_id(task)
+            self.store.add_many(tasks)
+            self._persist_batch([{"op": "put", "task": task.to_dict()} for task in tasks])
+        return tasks
+    
+    def delete_tasks_bulk(self, task_ids: Iterable[int]) -> int:
+        """Delete many tasks by ID, persist once and return how many existed."""
+        with self._locked(exclusive=True):
+            self._sync()
+            deleted = [task_id for task_id in task_ids if self.store.remove(task_id) is not None]
+            
+            if deleted:
+                self._persist_batch([{"op": "del", "id": task_id} for task_id in deleted])
+        return len(deleted)
     
-    def list_tasks(self, show_completed: bool = True, filter_priority: str = None) -> List[Task]:
+    def list_tasks(self, show_completed: bool = True, filter_priority: str = None,
+                   only_completed: bool = False) -> List[Task]:
         """List tasks with optional filters."""
-        filtered_tasks = self.tasks
+        return list(self.iter_tasks(show_completed, filter_priority, only_completed))
+    
+    def iter_tasks(self, show_completed: bool = True, filter_priority: str = None,
+                   only_completed: bool = False) -> Iterator[Task]:
+        """Lazily yield tasks sorted by priority (high -> medium -> low) and created date."""
+        completed = True if only_completed else (None if show_completed else False)
+        self.refresh()
+        return self.store.iter_ordered(filter_priority, completed)
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """Full-text search over titles and descriptions.
         
-        if not show_completed:
-            filtered_tasks = [task for task in filtered_tasks if not task.completed]
+        Each term matches words starting with it and every term must match;
+        results are ranked with title matches first.
+        """
+        self.refresh()
+        return self.store.search(query, limit)
+    
+    def get_stats(self, check: bool = False) -> Dict:
+        """Get task statistics.
+        
+        With ``check=True`` the counters are compared against a full recount
+        and a RuntimeError is raised if they have drifted.
+        """
+        self.refresh()
+        stats = self.store.stats()
+        if check:
+            expected = self.store.recount_stats()
+            if stats != expected:
+                raise RuntimeError(f"Task statistics out of sync: {stats} != {expected}")
+        return stats
+    
+    def save_tasks(self):
+        """Save tasks to JSON file."""
+        try:
+            with self._locked(exclusive=True):
+                # Pull in other processes' writes first so they aren't overwritten;
+                # a no-op when called from a mutation that has already synced
+                self._sync()
+                self._write_snapshot()
+        except Exception as e:
+            print(f"Error saving tasks: {e}")
+    
+    def compact(self):
+        """Fold the journal into a fresh snapshot and truncate it."""
+        try:
+            with self._locked(exclusive=True):
+                self._sync()
+                self._write_snapshot()
+                # A crash before truncation is harmless: replaying put/del
+                # records on top of the new snapshot gives the same state
+                self._close_journal()
+                with open(self.journal_filename, 'w'):
+                    pass
+                self._journal_records = 0
+                self._journal_offset = 0
+                self._journal_ino = os.stat(self.journal_filename).st_ino
+        except Exception as e:
+            print(f"Error compacting tasks: {e}")
+    
+    def close(self):
+        """Release the journal and lock file handles and the leased worker ID."""
+        self._close_journal()
+        self._ids.release()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+    
+    def _assign_id(self, task: Task):
+        # Call under the exclusive lock, after _sync(). Leased worker IDs
+        # keep processes apart; the check covers a misconfigured TASK_WORKER_ID
+        task.id = self._ids.next_id()
+        while self.store.get(task.id) is not None:
+            task.id = self._ids.next_id()
+    
+    def load_tasks(self):
+        """Load tasks from JSON file, then replay the journal if enabled."""
+        self.store.clear()
+        self._snapshot_signature = self._file_signature(self.filename)
+        if os.path.exists(self.filename):
+            try:
+                with open(self.filename, 'r') as f:
+                    task_data = json.load(f)
+                
+                self.store.clear()
+                max_id = max((data['id'] for data in task_data), default=0)
+                seen_ids = set()
+                tasks = []
+                for data in task_data:
+                    task = Task.from_dict(data)
+                    if task.id in seen_ids:
+                        # Older files can hold duplicate timestamp IDs; keep both tasks
+                        max_id += 1
+                        task.id = max_id
+                        print(f"Warning: duplicate task ID {data['id']} reassigned to {task.id}")
+                    seen_ids.add(task.id)
+                    tasks.append(task)
+                self.store.add_many(tasks)
+            except Exception as e:
+                print(f"Error loading tasks: {e}")
+                self.store.clear()
         
+        if self.journal:
+            # The append handle may point at a journal another process replaced
+            self._close_journal()
+            self._journal_records = 0
+            self._journal_offset = 0
+            self._journal_ino = None
+            self._replay_journal(0)
+    
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        # Re-entrant: nested calls run under the outermost lock
+        if fcntl is None or self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        
+        if self._lock_file is None:
+            self._lock_file = open(self.filename + ".lock", 'a')
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+    
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _sync(self):
+        # Must be called with the lock held
+        if self._file_signature(self.filename) != self._snapshot_signature:
+            self.load_tasks()
+            return
+        
+        if not self.journal:
+            return
+        
+        try:
+            st = os.stat(self.journal_filename)
+        except FileNotFoundError:
+            if self._journal_offset:
+                self.load_tasks()
+            return
+        
+        if self._journal_ino is not None and (
+                st.st_ino != self._journal_ino or st.st_size < self._journal_offset):
+            # Journal replaced or truncated behind our back; start over
+            self.load_tasks()
+        elif st.st_size > self._journal_offset:
+            self._replay_journal(self._journal_offset)
+    
+    def _write_snapshot(self):
+        # Write to a temp file and rename so a crash never leaves a truncated file
+        tmp_filename = self.filename + ".tmp"
+        with open(tmp_filename, 'w') as f:
+            json.dump([task.to_dict() for task in self.store], f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, self.filename)
+        self._snapshot_signature = self._file_signature(self.filename)
+    
+    def _persist_put(self, task: Task):
+        self._persist_batch([{"op": "put", "task": task.to_dict()}])
+    
+    def _persist_delete(self, task_id: int):
+        self._persist_batch([{"op": "del", "id": task_id}])
+    
+    def _persist_batch(self, records: List[Dict]):
+        if self.journal:
+            self._append_journal(records)
+        else:
+            self.save_tasks()
+    
+    def _append_journal(self, records: List[Dict]):
+        try:
+            if self._journal_file is None:
+                self._journal_file = open(self.journal_filename, 'ab')
+                self._journal_ino = os.fstat(self._journal_file.fileno()).st_ino
+            data = "".join(
+                json.dumps(record, separators=(',', ':')) + "\n" for record in records).encode()
+            self._journal_file.write(data)
+            self._journal_file.flush()
+            if self.fsync:
+                os.fsync(self._journal_file.fileno())
+            self._journal_records += len(records)
+            self._journal_offset += len(data)
+        except Exception as e:
+            print(f"Error writing journal: {e}")
+            return
+        
+        if self._journal_records >= self.compact_threshold:
+            self.compact()
+    
+    def _replay_journal(self, offset: int):
+        if not os.path.exists(self.journal_filename):
+            return
+        
+        good_offset = offset
+        with open(self.journal_filename, 'rb') as f:
+            self._journal_ino = os.fstat(f.fileno()).st_ino
+            f.seek(offset)
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final write from a crash; drop it and everything after
+                    print("Warning: discarding incomplete journal tail")
+                    break
+                
+                if record["op"] == "put":
+                    task = Task.from_dict(record["task"])
+                    self.store.remove(task.id)
+                    self.store.add(task)
+                elif record["op"] == "del":
+                    self.store.remove(record["id"])
+                good_offset += len(line)
+                self._journal_records += 1
+        
+        if good_offset != os.path.getsize(self.journal_filename):
+            # Writers hold the exclusive lock, so a torn line seen here is from a crash
+            with open(self.journal_filename, 'r+b') as f:
+                f.truncate(good_offset)
+        self._journal_offset = good_offset
+    
+    def _close_journal(self):
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+
+class SQLiteTaskManager:
+    """TaskManager with the same public API, backed by a SQLite file in WAL mode.
+    
+    Ordering and statistics are computed by indexed SQL queries, so startup
+    does not depend on the size of the task set.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL DEFAULT '',
+            priority TEXT NOT NULL,
+            priority_rank INTEGER NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            completed_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_order ON tasks (priority_rank, created_at);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_order ON tasks (completed, priority_rank, created_at);
+        -- Filtering by priority fixes the rank, so these return rows in created_at order
+        DROP INDEX IF EXISTS idx_tasks_priority_status;
+        CREATE INDEX IF NOT EXISTS idx_tasks_priority_status_order ON tasks (priority, completed, created_at);
+        CREATE INDEX IF NOT EXISTS idx_tasks_priority_order ON tasks (priority, created_at);
+    """
+    
+    # FTS5 index kept in sync with the tasks table by triggers
+    SEARCH_SCHEMA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            title, description, content='tasks', content_rowid='id'
+        );
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END;
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END;
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO tasks_fts (rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END;
+    """
+    
+    COLUMNS = "id, title, description, priority, completed, created_at, completed_at"
+    
+    def __init__(self, filename: str = "tasks.db"):
+        self.filename = filename
+        self._ids = TaskIdAllocator(lease_path=filename)
+        self.conn = sqlite3.connect(filename)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        
+        has_search = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").fetchone()
+        self.conn.executescript(self.SEARCH_SCHEMA)
+        if not has_search:
+            # Databases created before search existed need their index built once
+            with self.conn:
+                self.conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+    
+    def add_task(self, title: str, description: str = "", priority: str = "medium") -> Task:
+        """Add a new task."""
+        if not title.strip():
+            raise ValueError("Task title cannot be empty")
+        
+        task = Task(title.strip(), description.strip(), priority)
+        self._insert([task])
+        return task
+    
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """Get task by ID."""
+        row = self.conn.execute(
+            f"SELECT {self.COLUMNS} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return self._row_to_task(row) if row else None
+    
+    def update_task(self, task_id: int, title: str = None, description: str = None, 
+                   priority: str = None) -> bool:
+        """Update an existing task."""
+        fields = []
+        values = []
+        if title is not None:
+            fields.append("title = ?")
+            values.append(title.strip())
+        if description is not None:
+            fields.append("description = ?")
+            values.append(description.strip())
+        if priority is not None:
+            fields.append("priority = ?")
+            fields.append("priority_rank = ?")
+            values.extend([priority.lower(), PRIORITY_ORDER.get(priority.lower(), 1)])
+        
+        if not fields:
+            return self.get_task(task_id) is not None
+        
+        values.append(task_id)
+        with self.conn:
+            cursor = self.conn.execute(
+                f"UPDATE tasks SET {', '.join(fields)} WHERE id = ?", values)
+        return cursor.rowcount > 0
+    
+    def delete_task(self, task_id: int) -> bool:
+        """Delete a task by ID."""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        return cursor.rowcount > 0
+    
+    def toggle_task(self, task_id: int) -> bool:
+        """Toggle task completion status."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE tasks SET completed = 1 - completed, "
+                "completed_at = CASE WHEN completed THEN NULL ELSE ? END WHERE id = ?",
+                (datetime.now().isoformat(), task_id))
+        return cursor.rowcount > 0
+    
+    def add_tasks_bulk(self, rows: Iterable[Dict], errors: Optional[List[str]] = None,
+                       first_row: int = 1) -> List[Task]:
+        """Add many tasks in a single transaction (see TaskManager.add_tasks_bulk)."""
+        tasks = _build_tasks(rows, errors, first_row)
+        self._insert(tasks)
+        return tasks
+    
+    def delete_tasks_bulk(self, task_ids: Iterable[int]) -> int:
+        """Delete many tasks in a single transaction and return how many existed."""
+        with self.conn:
+            cursor = self.conn.executemany(
+                "DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id in task_ids])
+        return cursor.rowcount
+    
+    def list_tasks(self, show_completed: bool = True, filter_priority: str = None,
+                   only_completed: bool = False) -> List[Task]:
+        """List tasks with optional filters."""
+        return list(self.iter_tasks(show_completed, filter_priority, only_completed))
+    
+    def iter_tasks(self, show_completed: bool = True, filter_priority: str = None,
+                   only_completed: bool = False) -> Iterator[Task]:
+        """Lazily yield tasks in index order; rows are fetched as they are consumed."""
+        conditions = []
+        values = []
+        if only_completed:
+            conditions.append("completed = 1")
+        elif not show_completed:
+            conditions.append("completed = 0")
         if filter_priority:
-            filtered_tasks = [task for task in filtered_tasks if task.priority == filter_priority.lower()]
+            conditions.append("priority = ?")
+            values.append(filter_priority.lower())
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        # One priority means one rank; ordering by created_at alone lets the
+        # priority indexes return rows without a sort
+        order = "created_at" if filter_priority else "priority_rank, created_at"
+        rows = self.conn.execute(
+            f"SELECT {self.COLUMNS} FROM tasks {where} ORDER BY {order}",
+            values)
+        for row in rows:
+            yield self._row_to_task(row)
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """Full-text search over titles and descriptions (see TaskManager.search)."""
+        terms = TaskSearchIndex.tokenize(query)
+        if not terms:
+            return []
         
-        # Sort by priority (high -> medium -> low) and then by created date
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        return sorted(filtered_tasks, key=lambda t: (priority_order.get(t.priority, 1), t.created_at))
+        columns = ", ".join(f"tasks.{column.strip()}" for column in self.COLUMNS.split(","))
+        match = " AND ".join(f'"{term}"*' for term in terms)
+        rows = self.conn.execute(
+            f"SELECT {columns} FROM tasks_fts JOIN tasks ON tasks.id = tasks_fts.rowid "
+            f"WHERE tasks_fts MATCH ? ORDER BY bm25(tasks_fts, 3.0, 1.0) LIMIT ?",
+            (match, -1 if limit is None else limit))
+        return [self._row_to_task(row) for row in rows]
     
-    def get_stats(self) -> Dict:
-        """Get task statistics."""
-        total = len(self.tasks)
-        completed = sum(1 for task in self.tasks if task.completed)
-        pending = total - completed
+    def get_stats(self, check: bool = False) -> Dict:
+        """Get task statistics.
         
+        Counts always come straight from the table, so ``check`` has nothing
+        extra to verify and is accepted for API compatibility.
+        """
+        total = completed = 0
         priority_counts = {"high": 0, "medium": 0, "low": 0}
-        for task in self.tasks:
-            if not task.completed:
-                priority_counts[task.priority] = priority_counts.get(task.priority, 0) + 1
+        rows = self.conn.execute(
+            "SELECT priority, completed, COUNT(*) FROM tasks GROUP BY priority, completed")
+        for priority, is_completed, count in rows:
+            total += count
+            if is_completed:
+                completed += count
+            else:
+                priority_counts[priority] = priority_counts.get(priority, 0) + count
         
         return {
             "total": total,
             "completed": completed,
-            "pending": pending,
+            "pending": total - completed,
             "high_priority": priority_counts["high"],
             "medium_priority": priority_counts["medium"],
             "low_priority": priority_counts["low"]
         }
     
-    def save_tasks(self):
-        """Save tasks to JSON file."""
-        try:
-            with open(self.filename, 'w') as f:
-                json.dump([task.to_dict() for task in self.tasks], f, indent=2)
-        except Exception as e:
-            print(f"Error saving tasks: {e}")
+    def close(self):
+        """Close the database connection and release the leased worker ID."""
+        self.conn.close()
+        self._ids.release()
     
-    def load_tasks(self):
-        """Load tasks from JSON file."""
-        if not os.path.exists(self.filename):
-            return
-        
+    def _insert(self, tasks: List[Task], attempts: int = 3):
+        # Leased worker IDs keep processes apart, but an ID can still be
+        # taken (e.g. two processes given the same TASK_WORKER_ID); the
+        # transaction is rolled back, so renumber and try again
+        for attempt in range(attempts):
+            for task in tasks:
+                task.id = self._ids.next_id()
+            try:
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT INTO tasks (id, title, description, priority, priority_rank, "
+                        "completed, created_at, completed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(task.id, task.title, task.description, task.priority,
+                          task.priority_rank, int(task.completed),
+                          task.created_at, task.completed_at) for task in tasks])
+                return
+            except sqlite3.IntegrityError as e:
+                if "tasks.id" not in str(e) or attempt == attempts - 1:
+                    raise
+    
+    @staticmethod
+    def _row_to_task(row) -> Task:
+        task_id, title, description, priority, completed, created_at, completed_at = row
+        return Task.from_dict({
+            'id': task_id,
+            'title': title,
+            'description': description,
+            'priority': priority,
+            'completed': bool(completed),
+            'created_at': created_at,
+            'completed_at': completed_at
+        })
+
+def _build_tasks(rows: Iterable[Dict], errors: Optional[List[str]], first_row: int) -> List[Task]:
+    tasks = []
+    for row_number, row in enumerate(rows, start=first_row):
         try:
-            with open(self.filename, 'r') as f:
-                task_data = json.load(f)
-                self.tasks = [Task.from_dict(data) for data in task_data]
-        except Exception as e:
-            print(f"Error loading tasks: {e}")
-            self.tasks = []
+            tasks.append(task_from_row(row))
+        except (ValueError, TypeError, AttributeError) as e:
+            if errors is None:
+                raise ValueError(f"Row {row_number}: {e}") from e
+            errors.append(f"Row {row_number}: {e}")
+    return tasks
+
+def create_manager():
+    """Build the manager selected by TASK_STORAGE: json (default), journal or sqlite."""
+    storage = os.environ.get("TASK_STORAGE", "json").lower()
+    if storage == "sqlite":
+        return SQLiteTaskManager()
+    return TaskManager(journal=storage == "journal")
+
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+def _numbered_task_rows(path: str, fmt: Optional[str] = None) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    # (row_number, row, error); error is set and row is None for unparsable lines
+    with open(path, 'r', newline='') as f:
+        if _detect_format(path, fmt) == "csv":
+            for row_number, row in enumerate(csv.DictReader(f), start=1):
+                yield row_number, row, None
+        else:
+            row_number = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                row_number += 1
+                try:
+                    yield row_number, json.loads(line), None
+                except json.JSONDecodeError as e:
+                    yield row_number, None, f"invalid JSON: {e}"
+
+def read_task_rows(path: str, fmt: Optional[str] = None) -> Iterator[Dict]:
+    """Stream rows from a CSV file or a JSON-lines file.
+    
+    Raises ValueError on a line that is not valid JSON.
+    """
+    for row_number, row, error in _numbered_task_rows(path, fmt):
+        if error:
+            raise ValueError(f"Row {row_number}: {error}")
+        yield row
+
+def import_tasks(manager, path: str, fmt: Optional[str] = None, batch_size: int = 1000):
+    """Import tasks in batches, persisting once per batch.
+    
+    Returns ``(imported_count, errors)``; invalid rows, including lines that
+    are not valid JSON, are skipped and reported.
+    """
+    imported = 0
+    errors: List[str] = []
+    batch: List[Dict] = []
+    first_row = 1
+    for row_number, row, error in _numbered_task_rows(path, fmt):
+        if error:
+            # Flush first so every batch covers consecutive row numbers
+            if batch:
+                imported += len(manager.add_tasks_bulk(batch, errors, first_row))
+                batch = []
+            errors.append(f"Row {row_number}: {error}")
+            first_row = row_number + 1
+            continue
+        batch.append(row)
+        if len(batch) >= batch_size:
+            imported += len(manager.add_tasks_bulk(batch, errors, first_row))
+            first_row += len(batch)
+            batch = []
+    if batch:
+        imported += len(manager.add_tasks_bulk(batch, errors, first_row))
+    return imported, errors
+
+def export_tasks(manager, path: str, fmt: Optional[str] = None) -> int:
+    """Write every task to a CSV or JSON-lines file and return the count."""
+    fields = ['id', 'title', 'description', 'priority', 'completed', 'created_at', 'completed_at']
+    count = 0
+    with open(path, 'w', newline='') as f:
+        if _detect_format(path, fmt) == "csv":
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for task in manager.list_tasks():
+                writer.writerow(task.to_dict())
+                count += 1
+        else:
+            for task in manager.list_tasks():
+                f.write(json.dumps(task.to_dict(), separators=(',', ':')) + "\n")
+                count += 1
+    return count
 
 class TaskManagerCLI:
     """Command-line interface for the Task Manager."""
     
+    PAGE_SIZE = 10
+    
     def __init__(self):
-        self.manager = TaskManager()
+        self.manager = create_manager()
     
     def display_menu(self):
         """Display the main menu."""
@@ -190,7 +1308,8 @@ class TaskManagerCLI:
         print("5. Delete Task")
         print("6. View Statistics")
         print("7. Filter Tasks")
-        print("8. Exit")
+        print("8. Search Tasks")
+        print("9. Exit")
         print("="*50)
     
     def add_task_interactive(self):
@@ -224,21 +1343,8 @@ class TaskManagerCLI:
         show_completed = input("Show completed tasks? (y/n, default: y): ").strip().lower()
         show_completed = show_completed != 'n'
         
-        tasks = self.manager.list_tasks(show_completed=show_completed)
-        
-        if not tasks:
-            print("📝 No tasks found.")
-            return
-        
-        print(f"\nFound {len(tasks)} task(s):")
-        print("-" * 60)
-        
-        for task in tasks:
-            created = datetime.fromisoformat(task.created_at).strftime("%m/%d %H:%M")
-            print(f"ID: {task.id} | {task} | Created: {created}")
-            if task.description:
-                print(f"    📄 {task.description}")
-            print()
+        tasks = self.manager.iter_tasks(show_completed=show_completed)
+        self.show_task_pages(tasks, "📝 No tasks found.")
     
     def update_task_interactive(self):
         """Interactive task updating."""
@@ -291,6 +1397,7 @@ class TaskManagerCLI:
         old_status = "completed" if task.completed else "pending"
         
         if self.manager.toggle_task(task_id):
+            task = self.manager.get_task(task_id)
             new_status = "completed" if task.completed else "pending"
             print(f"✅ Task status changed from {old_status} to {new_status}!")
         else:
@@ -325,7 +1432,8 @@ class TaskManagerCLI:
     def show_statistics(self):
         """Display task statistics."""
         print("\n--- Task Statistics ---")
-        stats = self.manager.get_stats()
+        # TASK_CHECK_STATS=1 cross-checks the counters against a full recount
+        stats = self.manager.get_stats(check=os.environ.get("TASK_CHECK_STATS") == "1")
         
         print(f"📊 Total Tasks: {stats['total']}")
         print(f"✅ Completed: {stats['completed']}")
@@ -352,34 +1460,77 @@ class TaskManagerCLI:
         if choice == "1":
             priority = input("Enter priority (high/medium/low): ").strip().lower()
             if priority in ["high", "medium", "low"]:
-                tasks = self.manager.list_tasks(filter_priority=priority)
+                tasks = self.manager.iter_tasks(filter_priority=priority)
                 print(f"\n--- {priority.title()} Priority Tasks ---")
             else:
                 print("❌ Invalid priority!")
                 return
         elif choice == "2":
-            tasks = self.manager.list_tasks(show_completed=False)
+            tasks = self.manager.iter_tasks(show_completed=False)
             print("\n--- Pending Tasks ---")
         elif choice == "3":
-            tasks = [task for task in self.manager.tasks if task.completed]
+            tasks = self.manager.iter_tasks(only_completed=True)
             print("\n--- Completed Tasks ---")
         else:
             print("❌ Invalid choice!")
             return
         
-        if not tasks:
-            print("📝 No tasks found matching the filter.")
+        self.show_task_pages(tasks, "📝 No tasks found matching the filter.")
+    
+    def search_tasks_interactive(self):
+        """Interactive full-text search."""
+        print("\n--- Search Tasks ---")
+        query = input("Search for (words or word prefixes): ").strip()
+        
+        if not query:
+            print("❌ Search query cannot be empty!")
             return
         
-        print(f"Found {len(tasks)} task(s):")
-        print("-" * 60)
+        tasks = self.manager.search(query)
+        print(f"\n--- Results for '{query}' ({len(tasks)}) ---")
+        self.show_task_pages(iter(tasks), "📝 No tasks match your search.")
+    
+    def show_task_pages(self, tasks: Iterator[Task], empty_message: str):
+        """Print tasks one page at a time with next/previous navigation.
         
-        for task in tasks:
-            created = datetime.fromisoformat(task.created_at).strftime("%m/%d %H:%M")
-            print(f"ID: {task.id} | {task} | Created: {created}")
-            if task.description:
-                print(f"    📄 {task.description}")
-            print()
+        Pages are pulled from the iterator only when first shown and kept
+        so going back does not re-query.
+        """
+        pages: List[List[Task]] = []
+        page_index = 0
+        
+        while True:
+            if page_index == len(pages):
+                page = list(islice(tasks, self.PAGE_SIZE))
+                if not page:
+                    if not pages:
+                        print(empty_message)
+                        return
+                    # Ran past the end; stay on the last page
+                    page_index -= 1
+                    print("No more tasks.")
+                else:
+                    pages.append(page)
+            
+            print(f"\nPage {page_index + 1}:")
+            print("-" * 60)
+            for task in pages[page_index]:
+                created = task.created_datetime.strftime("%m/%d %H:%M")
+                print(f"ID: {task.id} | {task} | Created: {created}")
+                if task.description:
+                    print(f"    📄 {task.description}")
+                print()
+            
+            choice = input("[n]ext page, [p]revious page, [q]uit listing: ").strip().lower()
+            if choice == "n":
+                page_index += 1
+            elif choice == "p":
+                if page_index == 0:
+                    print("Already on the first page.")
+                else:
+                    page_index -= 1
+            else:
+                return
     
     def run(self):
         """Run the CLI application."""
@@ -387,7 +1538,7 @@ class TaskManagerCLI:
         
         while True:
             self.display_menu()
-            choice = input("\nEnter your choice (1-8): ").strip()
+            choice = input("\nEnter your choice (1-9): ").strip()
             
             if choice == "1":
                 self.add_task_interactive()
@@ -404,15 +1555,50 @@ class TaskManagerCLI:
             elif choice == "7":
                 self.filter_tasks_interactive()
             elif choice == "8":
+                self.search_tasks_interactive()
+            elif choice == "9":
                 print("\n👋 Thank you for using Task Manager!")
+                self.manager.close()
                 break
             else:
                 print("❌ Invalid choice! Please try again.")
             
             input("\nPress Enter to continue...")
 
+def run_command(argv: List[str]):
+    """Non-interactive import/export entry point."""
+    parser = argparse.ArgumentParser(description="Bulk import/export for Task Manager")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    import_parser = subparsers.add_parser("import", help="Import tasks from CSV or JSON lines")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--format", choices=["csv", "jsonl"])
+    import_parser.add_argument("--batch-size", type=int, default=1000)
+    
+    export_parser = subparsers.add_parser("export", help="Export tasks to CSV or JSON lines")
+    export_parser.add_argument("path")
+    export_parser.add_argument("--format", choices=["csv", "jsonl"])
+    
+    args = parser.parse_args(argv)
+    manager = create_manager()
+    try:
+        if args.command == "import":
+            imported, errors = import_tasks(manager, args.path, args.format, args.batch_size)
+            for error in errors:
+                print(f"❌ {error}")
+            print(f"✅ Imported {imported} task(s), skipped {len(errors)}.")
+        else:
+            count = export_tasks(manager, args.path, args.format)
+            print(f"✅ Exported {count} task(s) to {args.path}.")
+    finally:
+        manager.close()
+
 def main():
     """Main entry point of the application."""
+    if len(sys.argv) > 1:
+        run_command(sys.argv[1:])
+        return
+    
     try:
         cli = TaskManagerCLI()
         cli.run()
@@ -0,0 +1,47 @@
+"""Compare per-task add_task with add_tasks_bulk for each storage backend.
+
+Usage: python bench_bulk.py [count]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from Task import SQLiteTaskManager, TaskManager
+
+def make_rows(count):
+    priorities = ["low", "medium", "high"]
+    return [{"title": f"Task {i}", "description": "Imported task", "priority": priorities[i % 3]}
+            for i in range(count)]
+
+def make_manager(backend, directory):
+    if backend == "sqlite":
+        return SQLiteTaskManager(os.path.join(directory, "tasks.db"))
+    return TaskManager(os.path.join(directory, "tasks.json"), journal=backend == "journal")
+
+def bench(backend, rows, bulk):
+    with tempfile.TemporaryDirectory() as directory:
+        manager = make_manager(backend, directory)
+        start = time.perf_counter()
+        if bulk:
+            manager.add_tasks_bulk(rows)
+        else:
+            for row in rows:
+                manager.add_task(row["title"], row["description"], row["priority"])
+        elapsed = time.perf_counter() - start
+        manager.close()
+    return elapsed
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rows = make_rows(count)
+    
+    print(f"{'backend':<10}{'mode':<10}{'seconds':>10}{'tasks/s':>12}")
+    for backend in ["json", "journal", "sqlite"]:
+        for bulk in [False, True]:
+            elapsed = bench(backend, rows, bulk)
+            mode = "bulk" if bulk else "per-task"
+            print(f"{backend:<10}{mode:<10}{elapsed:>10.3f}{count / elapsed:>12.0f}")
+
+if __name__ == "__main__":
+    main()
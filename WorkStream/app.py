@@ -1,8 +1,17 @@
-from flask import Flask, jsonify, request, render_template
+from flask import Flask, Response, jsonify, request, render_template
 import mysql.connector
+import base64
+import threading
+import zlib
+from collections import OrderedDict
 from datetime import date
+from db_pool import ConnectionPool
+from change_feed import ChangeFeed
+from fast_response import init_app, columnar, wants_columnar
 
 app = Flask(__name__)
+# orjson encoding, gzip/brotli compression and ?format=columnar support
+init_app(app)
 
 # Database Configuration
 db_config = {
@@ -15,42 +24,287 @@ db_config = {
 def get_db_connection():
     return mysql.connector.connect(**db_config)
 
-# 1. READ: Get all jobs (Sorted by Due Date)
+# Shared pool: routes check a connection out instead of reconnecting per request
+pool = ConnectionPool(get_db_connection, max_size=10, timeout=5.0,
+                      max_idle=300.0, max_lifetime=3600.0)
+
+# Indexes backing keyset pagination and the filters on GET /api/jobs
+JOB_INDEXES = {
+    'idx_jobs_due_id': '(due_date, id)',
+    'idx_jobs_status_due_id': '(status, due_date, id)',
+    'idx_jobs_assignee_due_id': '(assignee, due_date, id)',
+}
+
+def ensure_indexes():
+    """Create any missing job indexes (MySQL has no CREATE INDEX IF NOT EXISTS)."""
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT DISTINCT index_name FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'jobs'")
+        existing = {row[0] for row in cursor.fetchall()}
+        for name, columns in JOB_INDEXES.items():
+            if name not in existing:
+                cursor.execute(f"CREATE INDEX {name} ON jobs {columns}")
+        conn.commit()
+        cursor.close()
+
+# Table version: a counter bumped in the same transaction as every write to
+# jobs. Living in the database, it is seen by every worker process; ETags
+# and cached responses are keyed on it, so a write invalidates them all.
+_version_table_ready = False
+_version_table_lock = threading.Lock()
+
+def ensure_version_table():
+    global _version_table_ready
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE IF NOT EXISTS jobs_version "
+                       "(id TINYINT PRIMARY KEY, version BIGINT NOT NULL)")
+        cursor.execute("INSERT IGNORE INTO jobs_version (id, version) VALUES (1, 0)")
+        conn.commit()
+        cursor.close()
+    _version_table_ready = True
+
+def _require_version_table():
+    # However the app is launched, the first use in a process creates the
+    # table. It runs on its own connection: CREATE TABLE commits implicitly
+    # and must not end the caller's transaction
+    if not _version_table_ready:
+        with _version_table_lock:
+            if not _version_table_ready:
+                ensure_version_table()
+
+def get_jobs_version(cursor):
+    _require_version_table()
+    cursor.execute("SELECT version FROM jobs_version WHERE id = 1")
+    return cursor.fetchone()[0]
+
+def bump_jobs_version(cursor):
+    """Call inside every write transaction, before commit."""
+    _require_version_table()
+    cursor.execute("UPDATE jobs_version SET version = version + 1 WHERE id = 1")
+
+# Serialized GET /api/jobs responses for the current table version
+PAYLOAD_CACHE_SIZE = 256
+_payload_cache = OrderedDict()
+_payload_cache_version = None
+_payload_lock = threading.Lock()
+
+def get_cached_payload(version, key):
+    with _payload_lock:
+        if version != _payload_cache_version or key not in _payload_cache:
+            return None
+        _payload_cache.move_to_end(key)
+        return _payload_cache[key]
+
+def store_cached_payload(version, key, payload):
+    global _payload_cache_version
+    with _payload_lock:
+        if _payload_cache_version is not None and version < _payload_cache_version:
+            return  # a newer version has already been cached
+        if version != _payload_cache_version:
+            _payload_cache.clear()
+            _payload_cache_version = version
+        _payload_cache[key] = payload
+        if len(_payload_cache) > PAYLOAD_CACHE_SIZE:
+            _payload_cache.popitem(last=False)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+def encode_cursor(job):
+    """Opaque keyset cursor for the last row of a page."""
+    raw = f"{job['due_date'].isoformat()}|{job['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor):
+    due_date, job_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+    return date.fromisoformat(due_date), int(job_id)
+
+def build_jobs_query(args):
+    """SQL, parameters and page size for one page of GET /api/jobs.
+    
+    Raises ValueError on malformed parameters.
+    """
+    limit = min(max(int(args.get('limit', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+    conditions = []
+    values = []
+    for key in ['status', 'assignee']:
+        if args.get(key):
+            conditions.append(f"{key} = %s")
+            values.append(args[key])
+    if args.get('due_from'):
+        conditions.append("due_date >= %s")
+        values.append(date.fromisoformat(args['due_from']))
+    if args.get('due_to'):
+        conditions.append("due_date <= %s")
+        values.append(date.fromisoformat(args['due_to']))
+    if args.get('cursor'):
+        # Keyset: rows strictly after the cursor in (due_date DESC, id DESC) order
+        due_date, job_id = decode_cursor(args['cursor'])
+        conditions.append("(due_date < %s OR (due_date = %s AND id < %s))")
+        values.extend([due_date, due_date, job_id])
+    
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    # Fetch one extra row to know whether another page exists
+    query = f"SELECT * FROM jobs {where} ORDER BY due_date DESC, id DESC LIMIT %s"
+    values.append(limit + 1)
+    return query, tuple(values), limit
+
+def jobs_etag(version, cache_key):
+    return f"jobs-{version}-{zlib.crc32(repr(cache_key).encode()):08x}"
+
+# 1. READ: Get jobs page by page (Sorted by Due Date)
+# Query params: limit, cursor, status, assignee, due_from, due_to (YYYY-MM-DD)
 @app.route('/api/jobs', methods=['GET'])
 def get_jobs():
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    # Sorting logic: Latest due dates first, as you requested before
-    cursor.execute("SELECT * FROM jobs ORDER BY due_date DESC")
-    jobs = cursor.fetchall()
+    try:
+        query, values, limit = build_jobs_query(request.args)
+    except ValueError:
+        return jsonify({'message': 'Invalid query parameters'}), 400
     
-    # Calculate stats for the header
-    total = len(jobs)
-    completed = sum(1 for job in jobs if job['status'] == 'Completed')
+    cache_key = tuple(sorted(request.args.items(multi=True)))
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        version = get_jobs_version(cursor)
+        cursor.close()
+        
+        # Conditional GET: same table version and query -> same response
+        etag = jobs_etag(version, cache_key)
+        # The ETag is always sent weak: compression would weaken it anyway,
+        # and only when the body is large enough, which a 304 can't know
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = 'no-cache'
+            response.vary.add('Accept-Encoding')
+            return response
+        
+        payload = get_cached_payload(version, cache_key)
+        if payload is None:
+            # ?format=columnar keeps the cursor's tuples instead of building a dict per row
+            as_columns = wants_columnar()
+            cursor = conn.cursor(dictionary=not as_columns)
+            # Sorting logic: Latest due dates first, as you requested before
+            cursor.execute(query, values)
+            jobs = cursor.fetchall()
+            columns = cursor.column_names
+            cursor.close()
+            
+            next_cursor = None
+            if len(jobs) > limit:
+                last = jobs[limit - 1]
+                next_cursor = encode_cursor(dict(zip(columns, last)) if as_columns else last)
+            jobs = jobs[:limit]
+            
+            # Header stats come from the cached aggregates, not from the rows
+            stats = job_stats_for_version(conn, version)
+            header_stats = {'total': stats['total'], 'completed': stats['completed']}
+            if as_columns:
+                body = columnar(columns, jobs, next_cursor=next_cursor, stats=header_stats)
+            else:
+                body = {'jobs': jobs, 'next_cursor': next_cursor, 'stats': header_stats}
+            payload = app.json.dumps(body)
+            store_cached_payload(version, cache_key, payload)
     
+    response = app.response_class(payload, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    # Let browsers keep the body but revalidate it with If-None-Match every time
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+# Aggregate stats cache, keyed on the table version and the current day
+# (the overdue count changes at midnight even without writes)
+_stats_cache = {'key': None, 'value': None}
+_stats_lock = threading.Lock()
+
+def get_job_stats():
+    """Per-status, per-assignee and overdue counts, computed by grouped SQL."""
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        version = get_jobs_version(cursor)
+        cursor.close()
+        return job_stats_for_version(conn, version)
+
+def job_stats_for_version(conn, version):
+    key = (version, date.today())
+    with _stats_lock:
+        if _stats_cache['key'] == key:
+            return _stats_cache['value']
+    
+    cursor = conn.cursor()
+    cursor.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+    by_status = {status: int(count) for status, count in cursor.fetchall()}
+    cursor.execute("SELECT assignee, COUNT(*) FROM jobs GROUP BY assignee")
+    by_assignee = {assignee or '': int(count) for assignee, count in cursor.fetchall()}
+    cursor.execute("SELECT COUNT(*) FROM jobs "
+                   "WHERE due_date < CURDATE() AND status <> 'Completed'")
+    overdue = int(cursor.fetchone()[0])
     cursor.close()
-    conn.close()
-    return jsonify({'jobs': jobs, 'stats': {'total': total, 'completed': completed}})
+    
+    stats = {
+        'total': sum(by_status.values()),
+        'completed': by_status.get('Completed', 0),
+        'overdue': overdue,
+        'by_status': by_status,
+        'by_assignee': by_assignee,
+    }
+    with _stats_lock:
+        _stats_cache['key'] = key
+        _stats_cache['value'] = stats
+    return stats
+
+@app.route('/api/jobs/stats', methods=['GET'])
+def job_stats():
+    return jsonify(get_job_stats())
+
+# Change feed: write routes publish per-job events that /api/jobs/stream
+# pushes to open pages, so they can patch their list instead of refetching
+feed = ChangeFeed()
+
+def fetch_jobs_by_id(conn, ids):
+    """Current rows for the given ids, for change events."""
+    if not ids:
+        return []
+    cursor = conn.cursor(dictionary=True)
+    placeholders = ', '.join(['%s'] * len(ids))
+    cursor.execute(f"SELECT * FROM jobs WHERE id IN ({placeholders})", tuple(ids))
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+def publish_job_changes(event_type, rows):
+    """Call after commit; deleted events only need {'id': ...}."""
+    for row in rows:
+        feed.publish(event_type, app.json.dumps(row))
+
+@app.route('/api/jobs/stream', methods=['GET'])
+def stream_jobs():
+    last_event_id = request.headers.get('Last-Event-ID')
+    return Response(feed.stream(last_event_id), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 # 2. CREATE: Add a new job
 @app.route('/api/jobs', methods=['POST'])
 def add_job():
     data = request.json
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    query = "INSERT INTO jobs (title, assignee, status, due_date) VALUES (%s, %s, %s, %s)"
-    cursor.execute(query, (data['title'], data['assignee'], 'Not Started', data['due_date']))
-    conn.commit()
-    cursor.close()
-    conn.close()
-    return jsonify({'message': 'Job added!'}), 201
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        query = "INSERT INTO jobs (title, assignee, status, due_date) VALUES (%s, %s, %s, %s)"
+        cursor.execute(query, (data['title'], data['assignee'], 'Not Started', data['due_date']))
+        job_id = cursor.lastrowid
+        bump_jobs_version(cursor)
+        created = fetch_jobs_by_id(conn, [job_id])
+        conn.commit()
+        cursor.close()
+    publish_job_changes('created', created)
+    return jsonify({'message': 'Job added!', 'id': job_id}), 201
 
 # 3. UPDATE: Change Status or Details
 @app.route('/api/jobs/<int:id>', methods=['PUT'])
 def update_job(id):
     data = request.json
-    conn = get_db_connection()
-    cursor = conn.cursor()
     
     # We allow updating specific fields dynamically
     fields = []
@@ -63,27 +317,190 @@ def update_job(id):
     values.append(id)
     query = f"UPDATE jobs SET {', '.join(fields)} WHERE id = %s"
     
-    cursor.execute(query, tuple(values))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(query, tuple(values))
+        bump_jobs_version(cursor)
+        updated = fetch_jobs_by_id(conn, [id])
+        conn.commit()
+        cursor.close()
+    publish_job_changes('updated', updated)
     return jsonify({'message': 'Job updated!'})
 
 # 4. DELETE: Remove a job
 @app.route('/api/jobs/<int:id>', methods=['DELETE'])
 def delete_job(id):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM jobs WHERE id = %s", (id,))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM jobs WHERE id = %s", (id,))
+        deleted = cursor.rowcount > 0
+        bump_jobs_version(cursor)
+        conn.commit()
+        cursor.close()
+    if deleted:
+        publish_job_changes('deleted', [{'id': id}])
     return jsonify({'message': 'Job deleted!'})
 
+# 5. BATCH: Create, update or delete many jobs in one transaction
+# Each route answers with one result per input item, in input order
+MAX_BATCH_SIZE = 1000
+JOB_FIELDS = ['title', 'assignee', 'status', 'due_date']
+
+def batch_items(key):
+    """The array in the request body (either the body itself or body[key])."""
+    data = request.json
+    items = data.get(key) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise ValueError(f"Expected a JSON array or an object with '{key}'")
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f"At most {MAX_BATCH_SIZE} items per batch")
+    return items
+
+# A multi-row INSERT is given one block of auto-increment ids, spaced
+# auto_increment_increment apart, only in InnoDB lock modes 0 and 1; in
+# mode 2 (the MySQL 8 default) concurrent inserts can interleave with it
+AUTO_INCREMENT_SETTINGS = "SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode"
+
+def block_insert_ids(settings, first_id, rowcount, count):
+    """Ids of the rows of one multi-row INSERT, from its lastrowid and rowcount."""
+    step, _ = settings
+    if rowcount != count:
+        raise RuntimeError(f"Multi-row INSERT added {rowcount} rows, expected {count}")
+    return [first_id + int(step) * offset for offset in range(count)]
+
+def insert_returning_ids(cursor, query, rows):
+    """Insert rows and return their auto-increment ids, in order."""
+    cursor.execute(AUTO_INCREMENT_SETTINGS)
+    settings = cursor.fetchone()
+    if int(settings[1]) == 2:
+        ids = []
+        for values in rows:
+            cursor.execute(query, values)
+            ids.append(cursor.lastrowid)
+        return ids
+    # executemany sends a single multi-row INSERT
+    cursor.executemany(query, rows)
+    return block_insert_ids(settings, cursor.lastrowid, cursor.rowcount, len(rows))
+
+def lock_existing_ids(cursor, ids):
+    """Lock the given job rows for this transaction and return the ids that exist."""
+    if not ids:
+        return set()
+    placeholders = ', '.join(['%s'] * len(ids))
+    cursor.execute(f"SELECT id FROM jobs WHERE id IN ({placeholders}) FOR UPDATE", tuple(ids))
+    return {row[0] for row in cursor.fetchall()}
+
+@app.route('/api/jobs/batch', methods=['POST'])
+def add_jobs_batch():
+    try:
+        items = batch_items('jobs')
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    results = [None] * len(items)
+    rows = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get('title') or not item.get('due_date'):
+            results[index] = {'index': index, 'status': 'error', 'error': 'title and due_date are required'}
+            continue
+        rows.append((index, (item['title'], item.get('assignee', ''), 'Not Started', item['due_date'])))
+    
+    if rows:
+        with pool.connection() as conn:
+            cursor = conn.cursor()
+            query = "INSERT INTO jobs (title, assignee, status, due_date) VALUES (%s, %s, %s, %s)"
+            ids = insert_returning_ids(cursor, query, [values for _, values in rows])
+            bump_jobs_version(cursor)
+            created = fetch_jobs_by_id(conn, ids)
+            conn.commit()
+            cursor.close()
+        publish_job_changes('created', created)
+        for job_id, (index, _) in zip(ids, rows):
+            results[index] = {'index': index, 'status': 'created', 'id': job_id}
+    
+    return jsonify({'results': results})
+
+@app.route('/api/jobs/batch', methods=['PUT'])
+def update_jobs_batch():
+    try:
+        items = batch_items('jobs')
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    results = [None] * len(items)
+    # Group updates by the set of fields they change so each group is one executemany
+    groups = {}
+    for index, item in enumerate(items):
+        fields = tuple(key for key in JOB_FIELDS if isinstance(item, dict) and key in item)
+        if not isinstance(item, dict) or not isinstance(item.get('id'), int) or not fields:
+            results[index] = {'index': index, 'status': 'error', 'error': 'id and at least one field are required'}
+            continue
+        groups.setdefault(fields, []).append((index, item))
+    
+    updated_ids = []
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        existing = lock_existing_ids(cursor, [item['id'] for group in groups.values() for _, item in group])
+        for fields, group in groups.items():
+            params = []
+            for index, item in group:
+                if item['id'] not in existing:
+                    results[index] = {'index': index, 'status': 'not_found', 'id': item['id']}
+                    continue
+                params.append(tuple(item[key] for key in fields) + (item['id'],))
+                results[index] = {'index': index, 'status': 'updated', 'id': item['id']}
+                updated_ids.append(item['id'])
+            if params:
+                query = f"UPDATE jobs SET {', '.join(f'{key} = %s' for key in fields)} WHERE id = %s"
+                cursor.executemany(query, params)
+        updated = []
+        if updated_ids:
+            bump_jobs_version(cursor)
+            updated = fetch_jobs_by_id(conn, sorted(set(updated_ids)))
+        conn.commit()
+        cursor.close()
+    publish_job_changes('updated', updated)
+    
+    return jsonify({'results': results})
+
+@app.route('/api/jobs/batch', methods=['DELETE'])
+def delete_jobs_batch():
+    try:
+        ids = batch_items('ids')
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    valid_ids = [job_id for job_id in ids if isinstance(job_id, int)]
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        existing = lock_existing_ids(cursor, valid_ids)
+        if existing:
+            placeholders = ', '.join(['%s'] * len(existing))
+            cursor.execute(f"DELETE FROM jobs WHERE id IN ({placeholders})", tuple(existing))
+            bump_jobs_version(cursor)
+        conn.commit()
+        cursor.close()
+    publish_job_changes('deleted', [{'id': job_id} for job_id in sorted(existing)])
+    
+    results = []
+    for index, job_id in enumerate(ids):
+        if not isinstance(job_id, int):
+            results.append({'index': index, 'status': 'error', 'error': 'id must be an integer'})
+        else:
+            results.append({'index': index, 'status': 'deleted' if job_id in existing else 'not_found', 'id': job_id})
+    return jsonify({'results': results})
+
+# Pool metrics: checkouts, wait times, idle/in-use counts
+@app.route('/api/pool/stats', methods=['GET'])
+def pool_stats():
+    return jsonify(pool.stats())
+
 # Serve the HTML page
 @app.route('/')
 def index():
     return render_template('index.html') 
 
 if __name__ == '__main__':
+    ensure_indexes()
+    ensure_version_table()
     app.run(debug=True)
\ No newline at end of file
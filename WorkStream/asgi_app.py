@@ -0,0 +1,339 @@
+"""Async entry point serving the same /api/jobs routes as app.py.
+
+Handlers are coroutines on Quart and talk to MySQL through an aiomysql
+pool, so a slow query parks a coroutine instead of a worker thread and
+one process can keep many requests in flight.
+
+    pip install quart aiomysql hypercorn
+    hypercorn asgi_app:app --bind 127.0.0.1:8000
+
+Query building, cursors, ETags and the payload cache are shared with
+app.py; only the I/O differs. GET /api/jobs?format=columnar returns the
+same columnar body as app.py. The change feed (/api/jobs/stream) is not
+served here, so the page falls back to refetching after each change.
+Responses are not compressed here (fast_response.init_app is Flask-only).
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+
+import aiomysql
+from quart import Quart, jsonify, request, render_template
+
+from fast_response import columnar
+from app import (db_config, ensure_indexes, ensure_version_table, pool as sync_pool,
+                 build_jobs_query, jobs_etag, encode_cursor, get_cached_payload,
+                 store_cached_payload, MAX_BATCH_SIZE, JOB_FIELDS,
+                 AUTO_INCREMENT_SETTINGS, block_insert_ids)
+
+app = Quart(__name__)
+
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 20
+POOL_TIMEOUT = 5.0     # seconds to wait for a free connection
+POOL_RECYCLE = 3600    # reconnect connections older than this (seconds)
+
+db = None
+
+@app.before_serving
+async def open_pool():
+    global db
+    # Schema setup is one-off, so reuse the synchronous helpers in a thread
+    await asyncio.to_thread(ensure_indexes)
+    await asyncio.to_thread(ensure_version_table)
+    sync_pool.close()
+
+    # autocommit: every read sees the latest committed data; writes opt
+    # into a transaction with transaction() below
+    db = await aiomysql.create_pool(
+        host=db_config['host'], user=db_config['user'], password=db_config['password'],
+        db=db_config['database'], minsize=POOL_MIN_SIZE, maxsize=POOL_MAX_SIZE,
+        pool_recycle=POOL_RECYCLE, autocommit=True)
+
+@app.after_serving
+async def close_pool():
+    db.close()
+    await db.wait_closed()
+
+@asynccontextmanager
+async def connection():
+    """Check out a pooled connection, waiting at most POOL_TIMEOUT seconds."""
+    conn = await asyncio.wait_for(db.acquire(), POOL_TIMEOUT)
+    try:
+        yield conn
+    finally:
+        db.release(conn)
+
+@asynccontextmanager
+async def transaction():
+    """Connection with an open transaction; committed on success, rolled back on error."""
+    async with connection() as conn:
+        await conn.begin()
+        try:
+            yield conn
+        except BaseException:
+            await conn.rollback()
+            raise
+        await conn.commit()
+
+async def fetch(conn, query, values=(), dictionary=False):
+    cursor_class = aiomysql.DictCursor if dictionary else aiomysql.Cursor
+    async with conn.cursor(cursor_class) as cursor:
+        await cursor.execute(query, values)
+        return await cursor.fetchall()
+
+async def get_jobs_version(conn):
+    rows = await fetch(conn, "SELECT version FROM jobs_version WHERE id = 1")
+    return rows[0][0]
+
+async def bump_jobs_version(cursor):
+    """Call inside every write transaction, before commit."""
+    await cursor.execute("UPDATE jobs_version SET version = version + 1 WHERE id = 1")
+
+# 1. READ: Get jobs page by page (Sorted by Due Date)
+@app.route('/api/jobs', methods=['GET'])
+async def get_jobs():
+    try:
+        query, values, limit = build_jobs_query(request.args)
+    except ValueError:
+        return jsonify({'message': 'Invalid query parameters'}), 400
+
+    cache_key = tuple(sorted(request.args.items(multi=True)))
+    async with connection() as conn:
+        version = await get_jobs_version(conn)
+
+        # Conditional GET: same table version and query -> same response
+        etag = jobs_etag(version, cache_key)
+        if request.if_none_match.contains(etag):
+            return '', 304, {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'}
+
+        payload = get_cached_payload(version, cache_key)
+        if payload is None:
+            # ?format=columnar keeps the cursor's tuples, as in app.py
+            as_columns = request.args.get('format') == 'columnar'
+            cursor_class = aiomysql.Cursor if as_columns else aiomysql.DictCursor
+            async with conn.cursor(cursor_class) as cursor:
+                await cursor.execute(query, values)
+                jobs = await cursor.fetchall()
+                columns = [column[0] for column in cursor.description]
+
+            next_cursor = None
+            if len(jobs) > limit:
+                last = jobs[limit - 1]
+                next_cursor = encode_cursor(dict(zip(columns, last)) if as_columns else last)
+            jobs = jobs[:limit]
+
+            stats = await job_stats_for_version(conn, version)
+            header_stats = {'total': stats['total'], 'completed': stats['completed']}
+            if as_columns:
+                body = columnar(columns, jobs, next_cursor=next_cursor, stats=header_stats)
+            else:
+                body = {'jobs': jobs, 'next_cursor': next_cursor, 'stats': header_stats}
+            payload = app.json.dumps(body)
+            store_cached_payload(version, cache_key, payload)
+
+    response = app.response_class(payload, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+# Aggregate stats cache, keyed on the table version and the current day
+_stats_cache = {'key': None, 'value': None}
+
+async def job_stats_for_version(conn, version):
+    key = (version, date.today())
+    if _stats_cache['key'] == key:
+        return _stats_cache['value']
+
+    by_status = {status: int(count) for status, count in
+                 await fetch(conn, "SELECT status, COUNT(*) FROM jobs GROUP BY status")}
+    by_assignee = {assignee or '': int(count) for assignee, count in
+                   await fetch(conn, "SELECT assignee, COUNT(*) FROM jobs GROUP BY assignee")}
+    overdue = (await fetch(conn, "SELECT COUNT(*) FROM jobs "
+                                 "WHERE due_date < CURDATE() AND status <> 'Completed'"))[0][0]
+
+    stats = {
+        'total': sum(by_status.values()),
+        'completed': by_status.get('Completed', 0),
+        'overdue': int(overdue),
+        'by_status': by_status,
+        'by_assignee': by_assignee,
+    }
+    _stats_cache['key'] = key
+    _stats_cache['value'] = stats
+    return stats
+
+@app.route('/api/jobs/stats', methods=['GET'])
+async def job_stats():
+    async with connection() as conn:
+        version = await get_jobs_version(conn)
+        return jsonify(await job_stats_for_version(conn, version))
+
+# 2. CREATE: Add a new job
+@app.route('/api/jobs', methods=['POST'])
+async def add_job():
+    data = await request.get_json()
+    async with transaction() as conn:
+        async with conn.cursor() as cursor:
+            query = "INSERT INTO jobs (title, assignee, status, due_date) VALUES (%s, %s, %s, %s)"
+            await cursor.execute(query, (data['title'], data['assignee'], 'Not Started', data['due_date']))
+            job_id = cursor.lastrowid
+            await bump_jobs_version(cursor)
+    return jsonify({'message': 'Job added!', 'id': job_id}), 201
+
+# 3. UPDATE: Change Status or Details
+@app.route('/api/jobs/<int:id>', methods=['PUT'])
+async def update_job(id):
+    data = await request.get_json()
+    fields = [key for key in JOB_FIELDS if key in data]
+    if not fields:
+        return jsonify({'message': 'No fields to update'}), 400
+
+    query = f"UPDATE jobs SET {', '.join(f'{key} = %s' for key in fields)} WHERE id = %s"
+    async with transaction() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query, tuple(data[key] for key in fields) + (id,))
+            await bump_jobs_version(cursor)
+    return jsonify({'message': 'Job updated!'})
+
+# 4. DELETE: Remove a job
+@app.route('/api/jobs/<int:id>', methods=['DELETE'])
+async def delete_job(id):
+    async with transaction() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute("DELETE FROM jobs WHERE id = %s", (id,))
+            await bump_jobs_version(cursor)
+    return jsonify({'message': 'Job deleted!'})
+
+# 5. BATCH: Create, update or delete many jobs in one transaction
+async def batch_items(key):
+    """The array in the request body (either the body itself or body[key])."""
+    data = await request.get_json()
+    items = data.get(key) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise ValueError(f"Expected a JSON array or an object with '{key}'")
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f"At most {MAX_BATCH_SIZE} items per batch")
+    return items
+
+async def insert_returning_ids(cursor, query, rows):
+    """Insert rows and return their auto-increment ids, in order (see app.py)."""
+    await cursor.execute(AUTO_INCREMENT_SETTINGS)
+    settings = await cursor.fetchone()
+    if int(settings[1]) == 2:
+        ids = []
+        for values in rows:
+            await cursor.execute(query, values)
+            ids.append(cursor.lastrowid)
+        return ids
+    await cursor.executemany(query, rows)
+    return block_insert_ids(settings, cursor.lastrowid, cursor.rowcount, len(rows))
+
+async def lock_existing_ids(cursor, ids):
+    """Lock the given job rows for this transaction and return the ids that exist."""
+    if not ids:
+        return set()
+    placeholders = ', '.join(['%s'] * len(ids))
+    await cursor.execute(f"SELECT id FROM jobs WHERE id IN ({placeholders}) FOR UPDATE", tuple(ids))
+    return {row[0] for row in await cursor.fetchall()}
+
+@app.route('/api/jobs/batch', methods=['POST'])
+async def add_jobs_batch():
+    try:
+        items = await batch_items('jobs')
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    results = [None] * len(items)
+    rows = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get('title') or not item.get('due_date'):
+            results[index] = {'index': index, 'status': 'error', 'error': 'title and due_date are required'}
+            continue
+        rows.append((index, (item['title'], item.get('assignee', ''), 'Not Started', item['due_date'])))
+
+    if rows:
+        async with transaction() as conn:
+            async with conn.cursor() as cursor:
+                query = "INSERT INTO jobs (title, assignee, status, due_date) VALUES (%s, %s, %s, %s)"
+                ids = await insert_returning_ids(cursor, query, [values for _, values in rows])
+                await bump_jobs_version(cursor)
+        for job_id, (index, _) in zip(ids, rows):
+            results[index] = {'index': index, 'status': 'created', 'id': job_id}
+
+    return jsonify({'results': results})
+
+@app.route('/api/jobs/batch', methods=['PUT'])
+async def update_jobs_batch():
+    try:
+        items = await batch_items('jobs')
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    results = [None] * len(items)
+    groups = {}
+    for index, item in enumerate(items):
+        fields = tuple(key for key in JOB_FIELDS if isinstance(item, dict) and key in item)
+        if not isinstance(item, dict) or not isinstance(item.get('id'), int) or not fields:
+            results[index] = {'index': index, 'status': 'error', 'error': 'id and at least one field are required'}
+            continue
+        groups.setdefault(fields, []).append((index, item))
+
+    async with transaction() as conn:
+        async with conn.cursor() as cursor:
+            existing = await lock_existing_ids(cursor, [item['id'] for group in groups.values() for _, item in group])
+            updated = False
+            for fields, group in groups.items():
+                params = []
+                for index, item in group:
+                    if item['id'] not in existing:
+                        results[index] = {'index': index, 'status': 'not_found', 'id': item['id']}
+                        continue
+                    params.append(tuple(item[key] for key in fields) + (item['id'],))
+                    results[index] = {'index': index, 'status': 'updated', 'id': item['id']}
+                if params:
+                    query = f"UPDATE jobs SET {', '.join(f'{key} = %s' for key in fields)} WHERE id = %s"
+                    await cursor.executemany(query, params)
+                    updated = True
+            if updated:
+                await bump_jobs_version(cursor)
+
+    return jsonify({'results': results})
+
+@app.route('/api/jobs/batch', methods=['DELETE'])
+async def delete_jobs_batch():
+    try:
+        ids = await batch_items('ids')
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    valid_ids = [job_id for job_id in ids if isinstance(job_id, int)]
+    async with transaction() as conn:
+        async with conn.cursor() as cursor:
+            existing = await lock_existing_ids(cursor, valid_ids)
+            if existing:
+                placeholders = ', '.join(['%s'] * len(existing))
+                await cursor.execute(f"DELETE FROM jobs WHERE id IN ({placeholders})", tuple(existing))
+                await bump_jobs_version(cursor)
+
+    results = []
+    for index, job_id in enumerate(ids):
+        if not isinstance(job_id, int):
+            results.append({'index': index, 'status': 'error', 'error': 'id must be an integer'})
+        else:
+            results.append({'index': index, 'status': 'deleted' if job_id in existing else 'not_found', 'id': job_id})
+    return jsonify({'results': results})
+
+# Pool metrics
+@app.route('/api/pool/stats', methods=['GET'])
+async def pool_stats():
+    return jsonify({'size': db.size, 'idle': db.freesize, 'in_use': db.size - db.freesize,
+                    'min_size': db.minsize, 'max_size': db.maxsize})
+
+# Serve the HTML page
+@app.route('/')
+async def index():
+    return await render_template('index.html')
+
+if __name__ == '__main__':
+    app.run(port=8000)
@@ -0,0 +1,79 @@
+"""Compare the single-job routes with the /api/jobs/batch routes.
+
+Start the server first (python app.py), then run:
+    python bench_batch.py [count] [base_url]
+
+Creates, reassigns and deletes `count` jobs once through the per-job
+routes and once through the batch routes, and prints the timings.
+"""
+import json
+import sys
+import time
+import urllib.request
+
+BASE_URL = 'http://127.0.0.1:5000'
+BATCH_SIZE = 1000  # the server's MAX_BATCH_SIZE
+
+
+def call(method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(BASE_URL + path, data=data, method=method,
+                                 headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(req) as response:
+        return json.loads(response.read() or b'null')
+
+
+def timed(label, count, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}{elapsed:>10.3f}s{count / elapsed:>12.0f} jobs/s")
+    return result
+
+
+def make_jobs(count, prefix):
+    return [{'title': f'{prefix} job {i}', 'assignee': 'bench', 'due_date': '2030-01-01'}
+            for i in range(count)]
+
+
+def run_single(count):
+    jobs = make_jobs(count, 'single')
+    created = timed('single: create', count, lambda: [call('POST', '/api/jobs', job) for job in jobs])
+    ids = [response['id'] for response in created]
+
+    timed('single: reassign', count,
+          lambda: [call('PUT', f'/api/jobs/{job_id}', {'assignee': 'bench-2'}) for job_id in ids])
+    timed('single: delete', count,
+          lambda: [call('DELETE', f'/api/jobs/{job_id}') for job_id in ids])
+
+
+def chunks(items, size=BATCH_SIZE):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def run_batch(count):
+    jobs = make_jobs(count, 'batch')
+    created = timed('batch: create', count,
+                    lambda: [call('POST', '/api/jobs/batch', {'jobs': chunk}) for chunk in chunks(jobs)])
+    ids = [result['id'] for response in created for result in response['results']
+           if result['status'] == 'created']
+
+    updates = [{'id': job_id, 'assignee': 'bench-2'} for job_id in ids]
+    timed('batch: reassign', count,
+          lambda: [call('PUT', '/api/jobs/batch', {'jobs': chunk}) for chunk in chunks(updates)])
+    timed('batch: delete', count,
+          lambda: [call('DELETE', '/api/jobs/batch', {'ids': chunk}) for chunk in chunks(ids)])
+
+
+def main():
+    global BASE_URL
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    if len(sys.argv) > 2:
+        BASE_URL = sys.argv[2].rstrip('/')
+
+    run_single(count)
+    run_batch(count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Load-test GET /api/jobs on the threaded Flask server and the ASGI server.
+
+Start both servers first:
+    python app.py                                   # Flask on :5000
+    hypercorn asgi_app:app --bind 127.0.0.1:8000    # Quart on :8000
+
+then run:
+    python bench_load.py [concurrency] [seconds]
+
+Each mode gets `concurrency` clients hammering the list endpoint for
+`seconds`. Every request filters on a different assignee, so it misses
+the payload cache and really queries MySQL. Prints requests/sec, p50/p99
+latency and how many requests failed (e.g. pool checkout timeouts).
+"""
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+MODES = {
+    'flask (threads)': 'http://127.0.0.1:5000',
+    'asgi (async)': 'http://127.0.0.1:8000',
+}
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))
+    return sorted_values[index]
+
+
+def client(base_url, worker, deadline, latencies, errors, lock):
+    i = 0
+    while time.perf_counter() < deadline:
+        url = f"{base_url}/api/jobs?limit=50&assignee=load-{worker}-{i}"
+        i += 1
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                response.read()
+            ok = True
+        except (urllib.error.URLError, OSError):
+            ok = False
+        elapsed = time.perf_counter() - start
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors[0] += 1
+
+
+def run(label, base_url, concurrency, seconds):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for worker in range(concurrency):
+            executor.submit(client, base_url, worker, deadline, latencies, errors, lock)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{label:<18}{len(latencies) / elapsed:>10.0f} req/s"
+          f"{percentile(latencies, 50) * 1000:>10.1f} ms p50"
+          f"{percentile(latencies, 99) * 1000:>10.1f} ms p99"
+          f"{errors[0]:>8} errors")
+
+
+def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"{concurrency} concurrent clients, {seconds:g}s per mode")
+    for label, base_url in MODES.items():
+        run(label, base_url, concurrency, seconds)
+
+
+if __name__ == '__main__':
+    main()
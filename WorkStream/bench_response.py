@@ -0,0 +1,79 @@
+"""Payload size and serialization time for the response formats in fast_response.
+
+Usage: python bench_response.py [rows ...]      (default: 10000 100000)
+
+For job rows (as in GET /api/jobs) and product rows (as in the Grocery
+/getProducts) it compares:
+- row dicts vs columnar, where the dicts are built from cursor-style tuples
+  as the DAO code does, so that cost is included
+- Flask's default JSON provider vs FastJSONProvider (orjson, if installed)
+- raw, gzip and brotli (if installed) body sizes and compression time
+"""
+import gzip
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from fast_response import FastJSONProvider, brotli, columnar, orjson
+
+app = Flask(__name__)
+ENCODERS = {'flask json': DefaultJSONProvider(app), 'fast json': FastJSONProvider(app)}
+
+
+def job_rows(count):
+    columns = ('id', 'title', 'assignee', 'status', 'due_date')
+    start = date(2030, 1, 1)
+    rows = [(i, f'Job number {i}', f'user{i % 40}', 'Completed' if i % 3 else 'Not Started',
+             start - timedelta(days=i % 365)) for i in range(count)]
+    return columns, rows
+
+
+def product_rows(count):
+    columns = ('product_id', 'name', 'unitMessure_id', 'price_per_unit', 'uomName')
+    rows = [(i, f'Product {i}', 1 + i % 3, Decimal(f'{1 + i % 500}.{i % 100:02d}'), ('each', 'kg', 'litre')[i % 3])
+            for i in range(count)]
+    return columns, rows
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def bench(dataset, count, columns, rows):
+    print(f"\n{dataset}, {count} rows")
+    print(f"{'format':<12}{'encoder':<12}{'build ms':>10}{'dumps ms':>10}{'raw KB':>10}"
+          f"{'gzip KB':>10}{'gzip ms':>10}{'br KB':>10}{'br ms':>10}")
+
+    shapes = {
+        'row dicts': lambda: [dict(zip(columns, row)) for row in rows],
+        'columnar': lambda: columnar(columns, rows),
+    }
+    for shape, build in shapes.items():
+        body, build_ms = timed(build)
+        for encoder_name, encoder in ENCODERS.items():
+            payload, dumps_ms = timed(lambda: encoder.dumps(body).encode())
+            gzipped, gzip_ms = timed(lambda: gzip.compress(payload, compresslevel=6))
+            line = (f"{shape:<12}{encoder_name:<12}{build_ms:>10.1f}{dumps_ms:>10.1f}"
+                    f"{len(payload) / 1024:>10.0f}{len(gzipped) / 1024:>10.0f}{gzip_ms:>10.1f}")
+            if brotli is not None:
+                brotlied, br_ms = timed(lambda: brotli.compress(payload, quality=5))
+                line += f"{len(brotlied) / 1024:>10.0f}{br_ms:>10.1f}"
+            print(line)
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10000, 100000]
+    print(f"orjson: {'yes' if orjson else 'no'}, brotli: {'yes' if brotli else 'no'}")
+    for count in counts:
+        bench('jobs', count, *job_rows(count))
+        bench('products', count, *product_rows(count))
+
+
+if __name__ == '__main__':
+    main()
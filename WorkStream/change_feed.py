@@ -0,0 +1,115 @@
+import queue
+import secrets
+import threading
+from collections import deque
+
+
+class Subscription:
+    __slots__ = ('queue', 'overflowed')
+
+    def __init__(self, max_queue):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+
+class ChangeFeed:
+    """In-process fan-out of job change events to server-sent-event clients.
+
+    Events are (id, type, data) where data is an already-serialized JSON
+    string, so each change is encoded once no matter how many clients
+    listen. A bounded history lets reconnecting clients resume from their
+    Last-Event-ID; clients that fall too far behind get a `reset` event and
+    should refetch their list.
+
+    Event IDs are "<epoch>-<n>", with a random epoch per feed: the counter
+    restarts with the process, so an ID from an earlier process (e.g.
+    before a reloader restart) must not be mistaken for a position in this
+    one. Such clients get a `reset` too.
+
+    Only writes made by this process are seen, which matches the single
+    process `app.run` server.
+    """
+
+    def __init__(self, history=1000, max_queue=1000, heartbeat=15.0):
+        self.heartbeat = heartbeat
+        self._max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._history = deque(maxlen=history)
+        self._next_id = 1
+        self.epoch = secrets.token_hex(4)
+
+    def publish(self, event_type, data):
+        with self._lock:
+            event = (self._next_id, event_type, data)
+            self._next_id += 1
+            self._history.append(event)
+            for sub in self._subscribers:
+                try:
+                    sub.queue.put_nowait(event)
+                except queue.Full:
+                    sub.overflowed = True
+
+    def stream(self, last_event_id=None):
+        """Iterator of SSE-formatted text for one client.
+
+        `last_event_id` is the client's Last-Event-ID header, if it sent one.
+
+        Subscribes immediately rather than on first iteration, so events
+        published before the response starts streaming are not lost.
+        """
+        sub = Subscription(self._max_queue)
+        with self._lock:
+            backlog, missed = self._backlog(last_event_id)
+            self._subscribers.add(sub)
+        return self._events(sub, backlog, missed)
+
+    def _events(self, sub, backlog, missed):
+        try:
+            if missed:
+                yield self._format(None, 'reset', '{}')
+            for event in backlog:
+                yield self._format(*event)
+
+            while True:
+                if sub.overflowed:
+                    # Too slow to keep up: drop what's queued and tell it to refetch
+                    while not sub.queue.empty():
+                        sub.queue.get_nowait()
+                    sub.overflowed = False
+                    yield self._format(None, 'reset', '{}')
+                try:
+                    event = sub.queue.get(timeout=self.heartbeat)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield self._format(*event)
+        finally:
+            with self._lock:
+                self._subscribers.discard(sub)
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def _backlog(self, last_event_id):
+        # Called with the lock held. Returns (events after last_event_id,
+        # whether the client must reset: some events were already evicted
+        # from the history, or the ID is not one this feed handed out)
+        if last_event_id is None:
+            return [], False
+        epoch, _, seq = last_event_id.partition('-')
+        if epoch != self.epoch or not seq.isdigit() or int(seq) >= self._next_id:
+            return [], True
+        seq = int(seq)
+        backlog = [event for event in self._history if event[0] > seq]
+        oldest = self._history[0][0] if self._history else self._next_id
+        return backlog, seq + 1 < oldest
+
+    def _format(self, event_id, event_type, data):
+        lines = []
+        if event_id is not None:
+            lines.append(f"id: {self.epoch}-{event_id}")
+        lines.append(f"event: {event_type}")
+        lines.append(f"data: {data}")
+        return "\n".join(lines) + "\n\n"
@@ -3,10 +3,19 @@ from youtube_transcript_api import YouTubeTranscriptApi
 import ollama
 import sqlite3
 import json
+import threading
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 # --- ⚙️ CONFIGURATION ---
 DB_FILE = "tubemind.db"
 MODEL_NAME = "llama3" # Make sure you have this pulled in Ollama
+PROMPT_VERSION = 2 # Bump when any summary prompt changes so old summaries are recomputed
+MAP_PROMPT_VERSION = 1 # Bump (with PROMPT_VERSION) when CHUNK_PROMPT changes; keys the chunk cache
+CHUNK_CHARS = 6000 # Transcript characters per map call
+REDUCE_CHARS = 6000 # Partial-summary characters per reduce call
+MAP_CONCURRENCY = 2 # Max concurrent requests to Ollama per server process (see OLLAMA_NUM_PARALLEL)
 
 # --- 💾 DATABASE SETUP ---
 def init_db():
@@ -14,6 +23,14 @@ def init_db():
     c = conn.cursor()
     c.execute('''CREATE TABLE IF NOT EXISTS videos
                  (id TEXT PRIMARY KEY, title TEXT, transcript TEXT, summary TEXT)''')
+    # One summary per (video, model, prompt version); videos.summary keeps the latest
+    c.execute('''CREATE TABLE IF NOT EXISTS summaries
+                 (video_id TEXT, model TEXT, prompt_version INTEGER, summary TEXT,
+                  PRIMARY KEY (video_id, model, prompt_version))''')
+    # Map-step results, keyed by chunk content so re-summarizing reuses them
+    c.execute('''CREATE TABLE IF NOT EXISTS chunk_summaries
+                 (chunk_hash TEXT, model TEXT, prompt_version INTEGER, summary TEXT,
+                  PRIMARY KEY (chunk_hash, model, prompt_version))''')
     conn.commit()
     conn.close()
 
@@ -36,22 +53,243 @@ def fetch_transcript(video_id):
     except Exception as e:
         return None
 
-def generate_summary(text):
-    """Sends text to Local LLM for summarization"""
-    prompt = f"""
+# --- 🧩 CHUNKED SUMMARIZATION ---
+# Long transcripts are summarized map-reduce style instead of being truncated:
+# each chunk is summarized on its own (in parallel, cached in SQLite), then
+# the partial summaries are merged in rounds until one final summary is left.
+CHUNK_PROMPT = """
+    You are a technical assistant. Summarize this part of a video transcript.
+    List the code concepts, libraries mentioned, and architectural decisions it covers.
+    Keep it under 150 words.
+    
+    Transcript part: {text}
+    """
+
+MERGE_PROMPT = """
+    You are a technical assistant. These are summaries of consecutive parts of one video.
+    Merge them into a single summary, keeping every distinct concept, library and decision.
+    Keep it under 300 words.
+    
+    Part summaries: {text}
+    """
+
+FINAL_PROMPT = """
     You are a technical assistant. Summarize the following video transcript. 
     Focus on extracting code concepts, libraries mentioned, and key architectural decisions.
     Keep it concise (under 200 words).
     
-    Transcript: {text[:10000]} 
-    """ 
-    # Truncating text to 10k chars to fit context window if needed
-    
-    response = ollama.chat(model=MODEL_NAME, messages=[
-        {'role': 'user', 'content': prompt},
-    ])
+    Transcript: {text} 
+    """
+
+@st.cache_resource
+def get_llm_slots():
+    # One limit for the whole server process, shared by every session and
+    # every summary in progress (see get_single_flight for why it's cached)
+    return threading.BoundedSemaphore(MAP_CONCURRENCY)
+
+# Resolved here, on the script thread, for use from worker threads
+llm_slots = get_llm_slots()
+
+def ask_llm(prompt):
+    with llm_slots:
+        response = ollama.chat(model=MODEL_NAME, messages=[
+            {'role': 'user', 'content': prompt},
+        ])
     return response['message']['content']
 
+def split_transcript(text, max_chars=CHUNK_CHARS):
+    """Splits text into chunks of at most max_chars, breaking between sentences.
+
+    Auto-generated captions often have no punctuation, so over-long
+    "sentences" are split between words instead.
+    """
+    pieces = []
+    for sentence in re.split(r'(?<=[.!?])\s+', text.strip()):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(' ', 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            pieces.append(sentence)
+
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+def get_cached_chunk_summary(chunk_hash):
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    row = conn.execute("SELECT summary FROM chunk_summaries WHERE chunk_hash=? AND model=? AND prompt_version=?",
+                       (chunk_hash, MODEL_NAME, MAP_PROMPT_VERSION)).fetchone()
+    conn.close()
+    return row[0] if row else None
+
+def save_chunk_summary(chunk_hash, summary):
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    conn.execute("INSERT OR REPLACE INTO chunk_summaries (chunk_hash, model, prompt_version, summary) VALUES (?, ?, ?, ?)",
+                 (chunk_hash, MODEL_NAME, MAP_PROMPT_VERSION, summary))
+    conn.commit()
+    conn.close()
+
+def summarize_chunk(chunk):
+    """Map step for one chunk, served from SQLite when already done."""
+    chunk_hash = hashlib.sha256(chunk.encode()).hexdigest()
+    summary = get_cached_chunk_summary(chunk_hash)
+    if summary is None:
+        summary = ask_llm(CHUNK_PROMPT.format(text=chunk))
+        save_chunk_summary(chunk_hash, summary)
+    return summary
+
+def group_by_size(texts, max_chars):
+    """Consecutive groups of texts whose combined length stays under max_chars.
+
+    Every group holds at least two texts (a lone leftover joins the last
+    group), even if that goes over max_chars, so each merge round shrinks.
+    """
+    groups = [[]]
+    size = 0
+    for text in texts:
+        if len(groups[-1]) >= 2 and size + len(text) > max_chars:
+            groups.append([])
+            size = 0
+        groups[-1].append(text)
+        size += len(text)
+    if len(groups) > 1 and len(groups[-1]) == 1:
+        groups[-2].extend(groups.pop())
+    return groups
+
+def generate_summary(text, log=print):
+    """Summarizes the whole transcript with the local LLM, however long it is"""
+    chunks = split_transcript(text)
+    if len(chunks) <= 1:
+        # Short video: one call, same as before
+        return ask_llm(FINAL_PROMPT.format(text=text))
+
+    # Map: chunk summaries in parallel, bounded so Ollama isn't flooded
+    log(f"🧩 Summarizing {len(chunks)} transcript parts...")
+    with ThreadPoolExecutor(max_workers=MAP_CONCURRENCY) as executor:
+        partials = list(executor.map(summarize_chunk, chunks))
+
+    # Reduce: merge neighbouring summaries in rounds until one fits a final
+    # call; every round at least halves the count, so this always ends
+    while len(partials) > 1 and sum(len(partial) for partial in partials) > REDUCE_CHARS:
+        groups = group_by_size(partials, REDUCE_CHARS)
+        log(f"🔗 Merging {len(partials)} part summaries...")
+        with ThreadPoolExecutor(max_workers=MAP_CONCURRENCY) as executor:
+            partials = list(executor.map(
+                lambda group: ask_llm(MERGE_PROMPT.format(text="\n\n".join(group))), groups))
+
+    return ask_llm(FINAL_PROMPT.format(text="\n\n".join(partials)))
+
+# --- ⚡ CACHE-FIRST INGESTION ---
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers wait and share its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {'done': threading.Event(), 'result': None, 'error': None}
+
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+
+        try:
+            call['result'] = fn()
+            return call['result']
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+
+@st.cache_resource
+def get_single_flight():
+    # Streamlit reruns this script per interaction and per session; the
+    # resource cache keeps one instance for the whole server process
+    return SingleFlight()
+
+def get_cached_transcript(video_id):
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    row = conn.execute("SELECT transcript FROM videos WHERE id=?", (video_id,)).fetchone()
+    conn.close()
+    return row[0] if row and row[0] else None
+
+def get_cached_summary(video_id, model=MODEL_NAME, prompt_version=PROMPT_VERSION):
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    row = conn.execute("SELECT summary FROM summaries WHERE video_id=? AND model=? AND prompt_version=?",
+                       (video_id, model, prompt_version)).fetchone()
+    conn.close()
+    return row[0] if row else None
+
+def save_transcript(video_id, title, transcript):
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    conn.execute("INSERT INTO videos (id, title, transcript) VALUES (?, ?, ?) "
+                 "ON CONFLICT(id) DO UPDATE SET transcript = excluded.transcript",
+                 (video_id, title, transcript))
+    conn.commit()
+    conn.close()
+
+def save_summary(video_id, summary, model=MODEL_NAME, prompt_version=PROMPT_VERSION):
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    conn.execute("INSERT OR REPLACE INTO summaries (video_id, model, prompt_version, summary) VALUES (?, ?, ?, ?)",
+                 (video_id, model, prompt_version, summary))
+    conn.execute("UPDATE videos SET summary = ? WHERE id = ?", (summary, video_id))
+    conn.commit()
+    conn.close()
+
+def ingest_video(video_id, log=print):
+    """Transcript and summary for a video, computing only what isn't stored yet.
+
+    Returns (transcript, summary); transcript is None if YouTube has no captions.
+    Concurrent calls for the same video share one fetch and one LLM run.
+    """
+    def work():
+        transcript = get_cached_transcript(video_id)
+        if transcript:
+            log("📦 Transcript already in library")
+        else:
+            log("📥 Fetching Transcript...")
+            transcript = fetch_transcript(video_id)
+            if not transcript:
+                return None, None
+            # Note: We don't have the real title easily without an API key,
+            # so we use a placeholder or extract from oEmbed (skipped for simplicity)
+            save_transcript(video_id, f"Video {video_id}", transcript)
+
+        summary = get_cached_summary(video_id)
+        if summary:
+            log("📦 Summary already in library")
+        else:
+            log("🤖 Generating AI Summary (Llama 3)...")
+            summary = generate_summary(transcript, log=log)
+            save_summary(video_id, summary)
+        return transcript, summary
+
+    # Fast path: both already stored, no need to queue behind anyone
+    transcript, summary = get_cached_transcript(video_id), get_cached_summary(video_id)
+    if transcript and summary:
+        return transcript, summary
+    return get_single_flight().do((video_id, MODEL_NAME, PROMPT_VERSION), work)
+
 # --- 🖥️ STREAMLIT UI ---
 def main():
     st.set_page_config(page_title="TubeMind AI", page_icon="🧠", layout="wide")
@@ -92,26 +330,12 @@ def main():
             st.error("Invalid YouTube URL")
         else:
             with st.status("🚀 Processing...", expanded=True) as status:
-                st.write("📥 Fetching Transcript...")
-                transcript = fetch_transcript(video_id)
+                transcript, summary = ingest_video(video_id, log=st.write)
                 
                 if not transcript:
                     status.update(label="❌ Failed to get transcript (Video might not have captions)", state="error")
                 else:
-                    st.write("🤖 Generating AI Summary (Llama 3)...")
-                    summary = generate_summary(transcript)
-                    
-                    # Save to DB
-                    # Note: We don't have the real title easily without an API key, 
-                    # so we use a placeholder or extract from oEmbed (skipped for simplicity)
-                    video_title = f"Video {video_id}" 
-                    
-                    conn = sqlite3.connect(DB_FILE)
-                    conn.execute("INSERT OR REPLACE INTO videos (id, title, transcript, summary) VALUES (?, ?, ?, ?)", 
-                                 (video_id, video_title, transcript, summary))
-                    conn.commit()
-                    conn.close()
-                    
+                    st.session_state['selected_video'] = video_id
                     status.update(label="✅ Done!", state="complete")
                     st.rerun()
 
@@ -123,6 +347,8 @@ def main():
         
         if data:
             vid_id, title, transcript, summary = data
+            # Prefer the summary for the current model and prompt
+            summary = get_cached_summary(vid_id) or summary
             
             col1, col2 = st.columns([1, 1])
             